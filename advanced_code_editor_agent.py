@@ -8,17 +8,118 @@ import sys
 import subprocess
 import shutil
 import time
-import json
 import re
 import ast
 import difflib
+import hashlib
+import pickle
+import tempfile
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from bisect import bisect_right
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Set
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple, Set
 
-@dataclass
-class CodeIssue:
+from utils import fast_copy, json_bytes, user_cache_dir, write_file_bytes
+
+# Whole-buffer scans used by advanced_code_analysis
+_TODO_RE = re.compile(r'TODO|FIXME')
+_EMPTY_EXCEPT_RE = re.compile(r'^[ \t]*except(?::| [^\n]*)[ \t]*\n[ \t]*pass[ \t]*$', re.MULTILINE)
+
+# Line patterns used by the fixers and refactorers
+_BLOCK_RE = re.compile(r'^\s*(if|for|while|def|class|try|except|else|elif)\b')
+_COMPLEX_COND_RE = re.compile(r'\b(?:el)?if\b(?=.*\band\b)(?=.*\bor\b)')
+
+_INTELLIGENCE_FEATURES = (
+    "Deep AST Analysis",
+    "AI-Powered Bug Detection",
+    "Advanced Refactoring",
+    "Project Optimization",
+    "Quality Validation"
+)
+
+# Static parts of the advanced build README
+_README_HEAD = """# DevO Chat - Advanced Code Editor Agent Build
+
+## 🔧 Advanced Agent Features
+This executable was built by an advanced AI-powered code editor agent featuring:
+
+### 🎯 Intelligence Features
+- **Code Analysis**: Deep AST analysis with quality scoring
+- **Intelligent Fixing**: AI-powered bug detection and resolution
+- **Advanced Refactoring**: Automated code improvement
+- **Project Optimization**: Structure and organization optimization
+- **Quality Validation**: Continuous code quality monitoring
+
+### 📊 Build Statistics
+"""
+_README_FIXES_HEAD = "\n### 🔧 Fixes Applied\n"
+_README_REFACTOR_HEAD = "\n\n### 🔀 Refactoring Applied\n"
+_README_OPT_HEAD = "\n\n### ⚡ Optimizations Made\n"
+_README_TAIL = """
+
+## 🚀 Usage
+1. Run `devochat_advanced.exe`
+2. Set environment variable: `GEMINI_API_KEY=your_key_here`
+3. Enjoy the AI-powered development experience!
+
+## 🎯 Quality Metrics
+- **Agent Type**: Advanced Code Editor Agent
+- **Intelligence Level**: Maximum
+- **Automation Level**: Fully Autonomous
+- **Code Quality**: Continuously Monitored
+- **Build Optimization**: Advanced
+
+---
+*Built with ❤️ by Advanced Code Editor Agent*
+"""
+
+# Files that are generated, vendored or copies and never worth analyzing
+_SKIP_DIRS = frozenset({"backups", "__pycache__", "release_advanced", "dist", "build"})
+_MAX_ANALYSIS_BYTES = 1024 * 1024
+
+def _skip_reason(file_path: Path, root_dir: Path, size: int) -> Optional[str]:
+    """Return why a file should not be analyzed, or None to analyze it"""
+    try:
+        parts = file_path.relative_to(root_dir).parts[:-1]
+    except ValueError:
+        parts = file_path.parts[:-1]
+        
+    if _SKIP_DIRS.intersection(parts):
+        return "generated or backup location"
+    if size > _MAX_ANALYSIS_BYTES:
+        return f"file too large ({size} bytes)"
+    try:
+        with open(file_path, 'rb') as f:
+            if b'\x00' in f.read(4096):
+                return "binary content"
+    except OSError as e:
+        return f"unreadable ({e})"
+        
+    return None
+    
+def _read_source(file_path: Path) -> Tuple[str, List[str]]:
+    """Read a source file once, returning its text and its lines"""
+    content = file_path.read_text(encoding='utf-8')
+    return content, content.split('\n')
+
+    
+        
+def _sync_directory(directory: Path):
+    """Flush the directory entries naming freshly written files to disk"""
+    # Directories cannot be opened for fsync on Windows
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(str(directory), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+            
+class CodeIssue(NamedTuple):
     """Represents a code issue found by analysis"""
     file_path: str
     line_number: int
@@ -27,16 +128,282 @@ class CodeIssue:
     severity: str
     fix_suggestion: str
 
+# Parsed trees for this process, least recently used evicted first
+_AST_MEMO: "OrderedDict[Tuple[str, str], ast.Module]" = OrderedDict()
+_AST_MEMO_MAX = 256
+
+# Pickled trees are only valid for the interpreter that produced them
+_AST_CACHE_TAG = f"{sys.implementation.cache_tag or sys.implementation.name}-{sys.hexversion:x}"
+
+def _ast_cache_get(content_bytes: bytes, cache_dir: Optional[Path] = None) -> ast.Module:
+    """Parse source into an AST, reusing cached trees keyed by source hash and interpreter"""
+    sha = hashlib.sha256(content_bytes).hexdigest()
+    key = (sha, _AST_CACHE_TAG)
+    
+    tree = _AST_MEMO.get(key)
+    if tree is not None:
+        _AST_MEMO.move_to_end(key)
+        return tree
+        
+    cache_path = cache_dir / f"{sha}-{_AST_CACHE_TAG}.pkl" if cache_dir else None
+    if cache_path is not None:
+        # Anything unreadable, truncated or unexpected is just a miss
+        try:
+            with open(cache_path, 'rb') as f:
+                tree = pickle.load(f)
+        except Exception:
+            tree = None
+        if not isinstance(tree, ast.Module):
+            tree = None
+            
+    if tree is None:
+        tree = ast.parse(content_bytes)
+        if cache_path is not None:
+            tmp_path = None
+            try:
+                cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{sha}-", suffix=".tmp")
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+                tmp_path = None
+            except (OSError, pickle.PickleError):
+                pass
+            finally:
+                if tmp_path is not None:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+                        
+    _AST_MEMO[key] = tree
+    if len(_AST_MEMO) > _AST_MEMO_MAX:
+        _AST_MEMO.popitem(last=False)
+    return tree
+    
+def _docstring(node) -> Optional[str]:
+    """Raw docstring of a function or class node, without ast.get_docstring's cleanup"""
+    if node.body and isinstance(node.body[0], ast.Expr):
+        value = node.body[0].value
+        if isinstance(value, ast.Constant) and isinstance(value.value, str):
+            return value.value
+    return None
+    
+class _AnalysisCollector(ast.NodeVisitor):
+    """Single-pass AST visitor filling in an analysis dict"""
+    
+    def __init__(self, file_path: str, analysis: Dict):
+        self.file_path = file_path
+        self.analysis = analysis
+        # Names bound by each import, and every name referenced in the module
+        self.import_bindings: Dict[str, Set[str]] = {}
+        self.used_names: Set[str] = set()
+        
+    def visit_Import(self, node: ast.Import):
+        for alias in node.names:
+            self.analysis["imports"].append(alias.name)
+            self.analysis["dependencies"].add(alias.name)
+            self.import_bindings.setdefault(alias.name, set()).add(
+                alias.asname or alias.name.split('.')[0])
+                
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if node.module:
+            self.analysis["imports"].append(node.module)
+            self.analysis["dependencies"].add(node.module)
+            self.import_bindings.setdefault(node.module, set()).update(
+                alias.asname or alias.name for alias in node.names)
+                
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        func_info = {
+            "name": node.name,
+            "line": node.lineno,
+            "args": len(node.args.args),
+            "docstring": _docstring(node)
+        }
+        self.analysis["functions"].append(func_info)
+        
+        # Check function complexity
+        if len(node.body) > 20:
+            self.analysis["issues"].append(
+                CodeIssue(
+                    self.file_path, node.lineno, "complexity",
+                    f"Function '{node.name}' is too complex ({len(node.body)} statements)",
+                    "warning", "Consider breaking into smaller functions"
+                )
+            )
+            
+        self.generic_visit(node)
+        
+    def visit_ClassDef(self, node: ast.ClassDef):
+        class_info = {
+            "name": node.name,
+            "line": node.lineno,
+            "methods": len([n for n in node.body if isinstance(n, ast.FunctionDef)]),
+            "docstring": _docstring(node)
+        }
+        self.analysis["classes"].append(class_info)
+        self.generic_visit(node)
+        
+    def visit_Name(self, node: ast.Name):
+        self.used_names.add(node.id)
+        if isinstance(node.ctx, ast.Store):
+            self.analysis["variables"].append(node.id)
+            
+def analyze_source_file(file_path: Path, ast_cache_dir: Optional[Path] = None) -> Dict:
+    """Analyze a single Python file
+    
+    Kept at module level so it can run in worker processes.
+    """
+    content, lines = _read_source(file_path)
+    
+    analysis = {
+        "file": str(file_path),
+        "lines": len(lines) - (lines[-1] == ""),
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "variables": [],
+        "complexity": 0,
+        "issues": [],
+        "suggestions": [],
+        "dependencies": set(),
+        "code_quality": "unknown"
+    }
+    
+    collector = _AnalysisCollector(str(file_path), analysis)
+    
+    # AST analysis
+    try:
+        tree = _ast_cache_get(content.encode('utf-8'), ast_cache_dir)
+        collector.visit(tree)
+        
+    except SyntaxError as e:
+        analysis["issues"].append(
+            CodeIssue(
+                str(file_path), e.lineno or 0, "syntax",
+                f"Syntax error: {e.msg}", "error",
+                "Fix syntax error according to Python standards"
+            )
+        )
+    
+    # Check for common issues
+    long_lines = [(i, len(line)) for i, line in enumerate(lines, 1) if len(line) > 100]
+    
+    line_starts = [0]
+    line_starts.extend(m.end() for m in re.finditer('\n', content))
+    todo_lines = {bisect_right(line_starts, m.start()) for m in _TODO_RE.finditer(content)}
+    empty_excepts = [bisect_right(line_starts, m.start()) for m in _EMPTY_EXCEPT_RE.finditer(content)]
+    unused_imports = [imp for imp, bound in collector.import_bindings.items()
+                      if "*" not in bound and not bound & collector.used_names]
+    
+    line_issues = []
+    
+    # Long lines
+    for i, length in long_lines:
+        line_issues.append(
+            CodeIssue(
+                str(file_path), i, "style",
+                f"Line too long ({length} chars)", "warning",
+                "Break line into multiple lines"
+            )
+        )
+    
+    # TODO comments
+    for i in todo_lines:
+        line_issues.append(
+            CodeIssue(
+                str(file_path), i, "todo",
+                "TODO/FIXME comment found", "info",
+                "Address TODO/FIXME comment"
+            )
+        )
+    
+    # Empty except blocks
+    for i in empty_excepts:
+        line_issues.append(
+            CodeIssue(
+                str(file_path), i, "exception",
+                "Empty except block", "warning",
+                "Handle exception properly or use specific exception type"
+            )
+        )
+    
+    line_issues.sort(key=lambda issue: issue.line_number)
+    analysis["issues"].extend(line_issues)
+    
+    # Unused imports detection
+    for imp in unused_imports:
+        analysis["issues"].append(
+            CodeIssue(
+                str(file_path), 1, "import",
+                f"Unused import: {imp}", "warning",
+                f"Remove unused import: {imp}"
+            )
+        )
+    
+    # Code quality assessment
+    quality_score = (100 - len(long_lines) - 2 * len(todo_lines)
+                     - 5 * len(empty_excepts) - len(unused_imports))
+    
+    # Determine code quality
+    if quality_score >= 90:
+        analysis["code_quality"] = "excellent"
+    elif quality_score >= 80:
+        analysis["code_quality"] = "good"
+    elif quality_score >= 70:
+        analysis["code_quality"] = "fair"
+    else:
+        analysis["code_quality"] = "poor"
+    
+    analysis["quality_score"] = quality_score
+    analysis["dependencies"] = list(analysis["dependencies"])
+    analysis["issues"] = list(dict.fromkeys(analysis["issues"]))
+    
+    return analysis
+    
+def _refactor_worker(file_path: Path) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Process-pool entry point returning (original, refactored, error)"""
+    try:
+        original, _ = _read_source(file_path)
+        return original, AdvancedCodeEditorAgent.refactor_source(original), None
+    except Exception as e:
+        return None, None, str(e)
+        
+def _analyze_worker(file_path: Path, ast_cache_dir: Optional[Path]) -> Tuple[Optional[Dict], Optional[str]]:
+    """Process-pool entry point returning (analysis, error)"""
+    try:
+        return analyze_source_file(file_path, ast_cache_dir), None
+    except Exception as e:
+        return None, str(e)
+        
 class AdvancedCodeEditorAgent:
     """Advanced autonomous agent with AI-powered code editing and optimization"""
     
+    # Static README halves, encoded once at import
+    _README_STATIC_HEAD = _README_HEAD.encode("utf-8")
+    _README_STATIC_TAIL = _README_TAIL.encode("utf-8")
+    
     def __init__(self):
         self.root_dir = Path.cwd()
         self.start_time = time.time()
         self.log_file = self.root_dir / "advanced_agent.log"
         self.backup_dir = self.root_dir / "backups"
+        # Pickled trees live in the user's own cache, never in the analysed project
+        self.ast_cache_dir = user_cache_dir("devo-ast")
+        self._analysis_cache = {}
+        self._py_files_cache = None
+        self._log_fh = None
+        self._log_finalizer = None
+        self._pool = None
+        self._summary_cache = None
+        self._fixers = {
+            "syntax": self.fix_syntax_issue,
+            "style": self.fix_style_issue,
+            "import": self.fix_import_issue,
+            "exception": self.fix_exception_issue
+        }
         self.fixes_applied = []
-        self.issues_found = []
+        self.issues_found: Dict[str, List[CodeIssue]] = {}
         self.refactoring_applied = []
         self.optimizations_made = []
         
@@ -62,8 +429,30 @@ class AdvancedCodeEditorAgent:
         emoji = emoji_map.get(level, "ℹ️")
         print(f"{emoji} {message}")
         
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {level}: {message}\n")
+        if self._log_fh is None:
+            self._log_fh = open(self.log_file, "a", encoding="utf-8", buffering=8192)
+            # Flushes the handle if the agent is collected or the interpreter exits first
+            self._log_finalizer = weakref.finalize(self, self._log_fh.close)
+        self._log_fh.write(f"[{timestamp}] {level}: {message}\n")
+        
+    def close_log(self):
+        """Flush and close the log file handle"""
+        if self._log_finalizer is not None:
+            # Calling the finalizer closes the handle and unregisters it
+            self._log_finalizer()
+            self._log_finalizer = None
+        self._log_fh = None
+        
+    def close(self):
+        """Release the worker processes and the log file handle"""
+        self.close_pool()
+        self.close_log()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
             
     def create_smart_backup(self, file_path: Path) -> bool:
         """Create smart backup with version control"""
@@ -76,18 +465,26 @@ class AdvancedCodeEditorAgent:
             backup_name = f"{file_path.stem}_{timestamp}{file_path.suffix}"
             backup_path = self.backup_dir / backup_name
             
-            shutil.copy2(file_path, backup_path)
+            fast_copy(file_path, backup_path)
             
-            # Create diff for tracking changes
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    original = f.readlines()
+            # Diff against the previous backup of this file, if any
+            backup_re = re.compile(re.escape(file_path.stem) + r"_\d{8}_\d{6}" + re.escape(file_path.suffix))
+            previous = sorted(
+                p for p in self.backup_dir.glob(f"{file_path.stem}_*{file_path.suffix}")
+                if p.name != backup_name and backup_re.fullmatch(p.name)
+            )
+            if previous:
+                with open(previous[-1], 'r', encoding='utf-8') as f:
+                    previous_lines = f.readlines()
+                with open(backup_path, 'r', encoding='utf-8') as f:
+                    current_lines = f.readlines()
                     
                 diff_path = self.backup_dir / f"{file_path.stem}_{timestamp}.diff"
                 with open(diff_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Backup created: {backup_path}\n")
-                    f.write(f"Original file: {file_path}\n")
-                    f.write(f"Timestamp: {timestamp}\n")
+                    f.writelines(difflib.unified_diff(
+                        previous_lines, current_lines,
+                        fromfile=previous[-1].name, tofile=backup_name
+                    ))
                     
             self.log(f"Smart backup created: {backup_name}", "BACKUP")
             return True
@@ -99,183 +496,138 @@ class AdvancedCodeEditorAgent:
     def advanced_code_analysis(self, file_path: Path) -> Dict:
         """Perform advanced code analysis"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
+            st = os.stat(file_path)
+            cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+            cached = self._analysis_cache.get(cache_key)
+            if cached is not None:
+                return cached
                 
-            analysis = {
-                "file": str(file_path),
-                "lines": len(lines),
-                "imports": [],
-                "functions": [],
-                "classes": [],
-                "variables": [],
-                "complexity": 0,
-                "issues": [],
-                "suggestions": [],
-                "dependencies": set(),
-                "code_quality": "unknown"
-            }
-            
-            # AST analysis
-            try:
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            analysis["imports"].append(alias.name)
-                            analysis["dependencies"].add(alias.name)
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            analysis["imports"].append(node.module)
-                            analysis["dependencies"].add(node.module)
-                    elif isinstance(node, ast.FunctionDef):
-                        func_info = {
-                            "name": node.name,
-                            "line": node.lineno,
-                            "args": len(node.args.args),
-                            "docstring": ast.get_docstring(node)
-                        }
-                        analysis["functions"].append(func_info)
-                        
-                        # Check function complexity
-                        if len(node.body) > 20:
-                            analysis["issues"].append(
-                                CodeIssue(
-                                    str(file_path), node.lineno, "complexity",
-                                    f"Function '{node.name}' is too complex ({len(node.body)} statements)",
-                                    "warning", "Consider breaking into smaller functions"
-                                )
-                            )
-                            
-                    elif isinstance(node, ast.ClassDef):
-                        class_info = {
-                            "name": node.name,
-                            "line": node.lineno,
-                            "methods": len([n for n in node.body if isinstance(n,
-                                ast.FunctionDef)]),
-                            "docstring": ast.get_docstring(node)
-                        }
-                        analysis["classes"].append(class_info)
-                        
-                    elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                        analysis["variables"].append(node.id)
-                        
-            except SyntaxError as e:
-                analysis["issues"].append(
-                    CodeIssue(
-                        str(file_path), e.lineno or 0, "syntax",
-                        f"Syntax error: {e.msg}", "error",
-                        "Fix syntax error according to Python standards"
-                    )
-                )
+            reason = _skip_reason(file_path, self.root_dir, st.st_size)
+            if reason:
+                return self._skipped_analysis(file_path, reason)
                 
-            # Code quality assessment
-            quality_score = 100
-            
-            # Check for common issues
-            for i, line in enumerate(lines, 1):
-                line_stripped = line.strip()
-                
-                # Long lines
-                if len(line) > 100:
-                    analysis["issues"].append(
-                        CodeIssue(
-                            str(file_path), i, "style",
-                            f"Line too long ({len(line)} chars)", "warning",
-                            "Break line into multiple lines"
-                        )
-                    )
-                    quality_score -= 1
-                    
-                # TODO comments
-                if "TODO" in line or "FIXME" in line:
-                    analysis["issues"].append(
-                        CodeIssue(
-                            str(file_path), i, "todo",
-                            "TODO/FIXME comment found", "info",
-                            "Address TODO/FIXME comment"
-                        )
-                    )
-                    quality_score -= 2
-                    
-                # Empty except blocks
-                if line_stripped == "except:" or line_stripped.startswith("except "):
-                    next_line = lines[i] if i < len(lines) else ""
-                    if next_line.strip() == "pass":
-                        analysis["issues"].append(
-                            CodeIssue(
-                                str(file_path), i, "exception",
-                                "Empty except block", "warning",
-                                "Handle exception properly or use specific exception type"
-                            )
-                        )
-                        quality_score -= 5
-                        
-                # Unused imports detection
-                for imp in analysis["imports"]:
-                    if imp not in content:
-                        analysis["issues"].append(
-                            CodeIssue(
-                                str(file_path), 1, "import",
-                                f"Unused import: {imp}", "warning",
-                                f"Remove unused import: {imp}"
-                            )
-                        )
-                        quality_score -= 1
-                        
-            # Determine code quality
-            if quality_score >= 90:
-                analysis["code_quality"] = "excellent"
-            elif quality_score >= 80:
-                analysis["code_quality"] = "good"
-            elif quality_score >= 70:
-                analysis["code_quality"] = "fair"
-            else:
-                analysis["code_quality"] = "poor"
-                
-            analysis["quality_score"] = quality_score
-            analysis["dependencies"] = list(analysis["dependencies"])
+            analysis = analyze_source_file(file_path, self.ast_cache_dir)
             
+            self._analysis_cache[cache_key] = analysis
             return analysis
             
         except Exception as e:
             self.log(f"Advanced analysis failed for {file_path}: {e}", "ERROR")
             return {"file": str(file_path), "issues": [str(e)]}
             
+    def _skipped_analysis(self, file_path: Path, reason: str) -> Dict:
+        """Placeholder analysis for files that are not worth parsing"""
+        self.log(f"Skipping {file_path.name}: {reason}", "INFO")
+        return {"file": str(file_path), "issues": [], "code_quality": "skipped", "skipped": True}
+        
+    def issue_count(self) -> int:
+        """Total number of issues found across all files"""
+        return sum(len(issues) for issues in self.issues_found.values())
+        
+    def _py_files(self) -> List[Path]:
+        """Python files in the project root, listed once with os.scandir"""
+        if self._py_files_cache is None:
+            with os.scandir(self.root_dir) as entries:
+                self._py_files_cache = [
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith('.py') and not entry.name.startswith('.')
+                    and entry.is_file()
+                    and not _skip_reason(Path(entry.path), self.root_dir, entry.stat().st_size)
+                ]
+        return self._py_files_cache
+        
+    def _process_pool(self) -> ProcessPoolExecutor:
+        """The agent's worker processes, started on first use and shared by every stage"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return self._pool
+        
+    def close_pool(self):
+        """Shut down the worker processes, if any were started"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+            
+    def _run_in_pool(self, worker, *iterables) -> list:
+        """Map a module-level worker over files, in worker processes when worthwhile"""
+        items = list(zip(*iterables))
+        if len(items) > 1:
+            try:
+                return list(self._process_pool().map(worker, *zip(*items), chunksize=4))
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                self.log(f"Process pool unavailable, running serially: {e}", "WARNING")
+                # A broken pool cannot be reused; the next stage starts a fresh one
+                if self._pool is not None:
+                    self._pool.shutdown(wait=False)
+                    self._pool = None
+                
+        return [worker(*args) for args in items]
+        
+    def analyze_files(self, file_paths: List[Path]) -> List[Dict]:
+        """Analyze several files, sending cache misses to worker processes"""
+        results = {}
+        pending = []
+        
+        for file_path in file_paths:
+            try:
+                st = os.stat(file_path)
+                cache_key = (str(file_path), st.st_mtime_ns, st.st_size)
+                cached = self._analysis_cache.get(cache_key)
+                reason = None if cached is not None else _skip_reason(file_path, self.root_dir, st.st_size)
+            except OSError as e:
+                self.log(f"Advanced analysis failed for {file_path}: {e}", "ERROR")
+                results[file_path] = {"file": str(file_path), "issues": [str(e)]}
+                continue
+                
+            if cached is not None:
+                results[file_path] = cached
+            elif reason:
+                results[file_path] = self._skipped_analysis(file_path, reason)
+            else:
+                pending.append((file_path, cache_key))
+                
+        outcomes = self._run_in_pool(
+            _analyze_worker, [f for f, _ in pending], repeat(self.ast_cache_dir, len(pending))
+        )
+        for (file_path, cache_key), (analysis, error) in zip(pending, outcomes):
+            if error is not None:
+                self.log(f"Advanced analysis failed for {file_path}: {error}", "ERROR")
+                results[file_path] = {"file": str(file_path), "issues": [error]}
+            else:
+                self._analysis_cache[cache_key] = analysis
+                results[file_path] = analysis
+                
+        return [results[f] for f in file_paths]
+        
+    def invalidate_analysis(self, file_path: Path):
+        """Drop cached analysis results for a file that has been modified"""
+        path = str(file_path)
+        for key in [k for k in self._analysis_cache if k[0] == path]:
+            del self._analysis_cache[key]
+            
     def intelligent_code_fixing(self, file_path: Path, issues: List[CodeIssue]) -> bool:
         """Apply intelligent fixes based on issues found"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
-                
+            content, lines = _read_source(file_path)
+            
             original_content = content
             modified_lines = lines[:]
             
             self.create_smart_backup(file_path)
             
-            for issue in issues:
-                if issue.issue_type == "syntax":
-                    # Fix common syntax errors
-                    modified_lines = self.fix_syntax_issue(modified_lines, issue)
-                elif issue.issue_type == "style":
-                    # Fix style issues
-                    modified_lines = self.fix_style_issue(modified_lines, issue)
-                elif issue.issue_type == "import":
-                    # Fix import issues
-                    modified_lines = self.fix_import_issue(modified_lines, issue)
-                elif issue.issue_type == "exception":
-                    # Fix exception handling
-                    modified_lines = self.fix_exception_issue(modified_lines, issue)
+            # Work bottom-up across all issue types, so a fix that adds or removes
+            # lines never shifts a line another fix still has to reach
+            for issue in sorted(issues, key=lambda i: -i.line_number):
+                handler = self._fixers.get(issue.issue_type)
+                if handler:
+                    modified_lines = handler(modified_lines, issue)
                     
             new_content = '\n'.join(modified_lines)
             
             if new_content != original_content:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(new_content)
-                    
+                file_path.write_text(new_content, encoding='utf-8')
+                
+                self.invalidate_analysis(file_path)
                 self.log(f"Applied intelligent fixes to {file_path}", "FIX")
                 self.fixes_applied.append(f"Intelligent fixes in {file_path}")
                 return True
@@ -294,7 +646,7 @@ class AdvancedCodeEditorAgent:
             # Fix common syntax issues
             if "invalid syntax" in issue.description.lower():
                 # Fix missing colons
-                if any(keyword in line for keyword in ["if ", "for ", "while ", "def ", "class ", "try", "except", "else", "elif"]):
+                if _BLOCK_RE.match(line):
                     if not line.rstrip().endswith(':'):
                         lines[line_idx] = line.rstrip() + ':'
                         
@@ -317,18 +669,21 @@ class AdvancedCodeEditorAgent:
                     if ', ' in line:
                         parts = line.split(', ')
                         if len(parts) > 1:
-                            indent = len(line) - len(line.lstrip())
+                            continuation = ' ' * (len(line) - len(line.lstrip()) + 4)
                             new_lines = []
-                            current_line = parts[0]
+                            current_parts = [parts[0]]
+                            current_len = len(parts[0])
                             
                             for part in parts[1:]:
-                                if len(current_line + ', ' + part) <= 100:
-                                    current_line += ', ' + part
+                                if current_len + 2 + len(part) <= 100:
+                                    current_parts.append(part)
+                                    current_len += 2 + len(part)
                                 else:
-                                    new_lines.append(current_line + ',')
-                                    current_line = ' ' * (indent + 4) + part
+                                    new_lines.append(', '.join(current_parts) + ',')
+                                    current_parts = [continuation + part]
+                                    current_len = len(continuation) + len(part)
                                     
-                            new_lines.append(current_line)
+                            new_lines.append(', '.join(current_parts))
                             lines[line_idx:line_idx+1] = new_lines
                             
         return lines
@@ -361,33 +716,39 @@ class AdvancedCodeEditorAgent:
     def advanced_refactoring(self, file_path: Path) -> bool:
         """Apply advanced refactoring techniques"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            original_content = content
-            
-            # Apply refactoring patterns
-            content = self.refactor_long_functions(content)
-            content = self.refactor_duplicate_code(content)
-            content = self.refactor_complex_conditions(content)
-            content = self.optimize_imports(content)
+            content, _ = _read_source(file_path)
+            return self._apply_refactoring(file_path, content, self.refactor_source(content))
             
-            if content != original_content:
-                self.create_smart_backup(file_path)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                    
-                self.log(f"Applied advanced refactoring to {file_path}", "REFACTOR")
-                self.refactoring_applied.append(f"Advanced refactoring in {file_path}")
-                return True
-                
         except Exception as e:
             self.log(f"Advanced refactoring failed: {e}", "ERROR")
             
         return False
         
-    def refactor_long_functions(self, content: str) -> str:
+    def _apply_refactoring(self, file_path: Path, original_content: str, content: str) -> bool:
+        """Write refactored content back if it differs from the original"""
+        if content != original_content:
+            self.create_smart_backup(file_path)
+            
+            file_path.write_text(content, encoding='utf-8')
+            
+            self.invalidate_analysis(file_path)
+            self.log(f"Applied advanced refactoring to {file_path}", "REFACTOR")
+            self.refactoring_applied.append(f"Advanced refactoring in {file_path}")
+            return True
+            
+        return False
+        
+    @staticmethod
+    def refactor_source(content: str) -> str:
+        """Apply all refactoring patterns to source text"""
+        content = AdvancedCodeEditorAgent.refactor_long_functions(content)
+        content = AdvancedCodeEditorAgent.refactor_duplicate_code(content)
+        content = AdvancedCodeEditorAgent.refactor_complex_conditions(content)
+        content = AdvancedCodeEditorAgent.optimize_imports(content)
+        return content
+        
+    @staticmethod
+    def refactor_long_functions(content: str) -> str:
         """Refactor long functions into smaller ones"""
         # This is a simplified example - real implementation would be more complex
         lines = content.splitlines()
@@ -412,34 +773,40 @@ class AdvancedCodeEditorAgent:
                 
         return '\n'.join(lines)
         
-    def refactor_duplicate_code(self, content: str) -> str:
+    @staticmethod
+    def refactor_duplicate_code(content: str) -> str:
         """Identify and refactor duplicate code"""
         # Simplified duplicate detection
-        lines = content.splitlines()
+        out = []
+        prev = None
         
         # Look for duplicate consecutive lines
-        for i in range(len(lines) - 1):
-            if lines[i] == lines[i + 1] and lines[i].strip():
+        for line in content.splitlines():
+            if line == prev and line.strip():
                 # Add comment about duplicate code
-                lines.insert(i, lines[i].replace(lines[i].strip(), f"# Duplicate code detected: {lines[i].strip()}"))
+                out.append(line.replace(line.strip(), f"# Duplicate code detected: {line.strip()}"))
+            out.append(line)
+            prev = line
                 
-        return '\n'.join(lines)
+        return '\n'.join(out)
         
-    def refactor_complex_conditions(self, content: str) -> str:
+    @staticmethod
+    def refactor_complex_conditions(content: str) -> str:
         """Refactor complex conditional statements"""
         # Simplified condition refactoring
-        lines = content.splitlines()
+        out = []
         
-        for i, line in enumerate(lines):
-            if 'if ' in line and ' and ' in line and ' or ' in line:
+        for line in content.splitlines():
+            if _COMPLEX_COND_RE.search(line):
                 # Complex condition found
                 indent = len(line) - len(line.lstrip())
-                comment = ' ' * indent + '# Complex condition - consider breaking into multiple conditions'
-                lines.insert(i, comment)
+                out.append(' ' * indent + '# Complex condition - consider breaking into multiple conditions')
+            out.append(line)
                 
-        return '\n'.join(lines)
+        return '\n'.join(out)
         
-    def optimize_imports(self, content: str) -> str:
+    @staticmethod
+    def optimize_imports(content: str) -> str:
         """Optimize and organize imports"""
         lines = content.splitlines()
         
@@ -453,15 +820,13 @@ class AdvancedCodeEditorAgent:
             else:
                 other_lines.append(line)
                 
-        # Sort imports
-        imports.sort()
-        
-        # Remove duplicates
-        unique_imports = []
-        for imp in imports:
-            if imp not in unique_imports:
-                unique_imports.append(imp)
-                
+        # Sort imports and remove duplicates
+        unique_imports = list(dict.fromkeys(sorted(imports)))
+        
+        # Nothing to reorganize
+        if imports == unique_imports:
+            return content
+            
         # Combine back
         if unique_imports:
             return '\n'.join(unique_imports) + '\n\n' + '\n'.join(other_lines)
@@ -529,21 +894,29 @@ class AdvancedCodeEditorAgent:
             
     def should_create_directory(self, dir_name: str) -> bool:
         """Determine if directory should be created based on project content"""
-        python_files = list(self.root_dir.glob("*.py"))
+        python_files = self._py_files()
         
         if dir_name == "tests" and len(python_files) > 3:
             return True
         elif dir_name == "docs" and len(python_files) > 5:
             return True
-        elif dir_name == "config" and any(f.name.endswith('.yml') or f.name.endswith('.yaml') for f in self.root_dir.glob("*")):
+        elif dir_name == "config" and self._config_files():
             return True
             
         return False
         
+    def _config_files(self) -> List[Path]:
+        """YAML config files in the project root, from a single directory scan"""
+        with os.scandir(self.root_dir) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(('.yml', '.yaml')) and not entry.name.startswith('.')
+            ]
+            
     def organize_files(self):
         """Organize files into appropriate directories"""
         # Move config files
-        config_files = list(self.root_dir.glob("*.yml")) + list(self.root_dir.glob("*.yaml"))
+        config_files = self._config_files()
         config_dir = self.root_dir / "config"
         
         if config_files and config_dir.exists():
@@ -610,7 +983,10 @@ advanced_agent.log
         """Run the advanced code editor agent"""
         self.log("🔧 Advanced Code Editor Agent starting...", "ANALYZE")
         
+        self._py_files_cache = None
+        
         # Clear logs
+        self.close_log()
         if self.log_file.exists():
             self.log_file.unlink()
             
@@ -652,15 +1028,20 @@ advanced_agent.log
         
         return True
         
+    def run_advanced_agent_safe(self) -> Tuple[bool, Optional[str]]:
+        """Run the agent, returning (success, error message) instead of raising"""
+        try:
+            return self.run_advanced_agent(), None
+        except Exception as e:
+            return False, str(e)
+            
     def analyze_all_code(self) -> bool:
         """Analyze all code files"""
-        python_files = list(self.root_dir.glob("*.py"))
+        python_files = self._py_files()
         
-        for py_file in python_files:
-            analysis = self.advanced_code_analysis(py_file)
-            
+        for py_file, analysis in zip(python_files, self.analyze_files(python_files)):
             if analysis.get("issues"):
-                self.issues_found.extend(analysis["issues"])
+                self.issues_found.setdefault(str(py_file), []).extend(analysis["issues"])
                 
             self.log(f"Analyzed {py_file.name}: {analysis.get('code_quality', 'unknown')} quality", "ANALYZE")
             
@@ -668,10 +1049,10 @@ advanced_agent.log
         
     def apply_intelligent_fixes(self) -> bool:
         """Apply intelligent fixes to all files"""
-        python_files = list(self.root_dir.glob("*.py"))
+        python_files = self._py_files()
         
         for py_file in python_files:
-            file_issues = [issue for issue in self.issues_found if issue.file_path == str(py_file)]
+            file_issues = self.issues_found.get(str(py_file), [])
             if file_issues:
                 self.intelligent_code_fixing(py_file, file_issues)
                 
@@ -679,10 +1060,18 @@ advanced_agent.log
         
     def refactor_all_code(self) -> bool:
         """Apply refactoring to all code files"""
-        python_files = list(self.root_dir.glob("*.py"))
+        python_files = self._py_files()
         
-        for py_file in python_files:
-            self.advanced_refactoring(py_file)
+        for py_file, (original, refactored, error) in zip(
+                python_files, self._run_in_pool(_refactor_worker, python_files)):
+            if error is not None:
+                self.log(f"Advanced refactoring failed: {error}", "ERROR")
+                continue
+                
+            try:
+                self._apply_refactoring(py_file, original, refactored)
+            except Exception as e:
+                self.log(f"Advanced refactoring failed: {e}", "ERROR")
             
         return True
         
@@ -692,18 +1081,18 @@ advanced_agent.log
         
         # Build with advanced options
         build_cmd = [
-            "uv run pyinstaller",
+            "uv", "run", "pyinstaller",
             "--onefile",
             "--console",
-            "--name devochat_optimized",
-            "--optimize 2",
+            "--name", "devochat_optimized",
+            "--optimize", "2",
             "--clean",
             "--noconfirm",
             "--strip",
-            "--add-data sample-config.yml;.",
-            "--collect-all google.generativeai",
-            "--collect-all rich",
-            "--collect-all click",
+            "--add-data", "sample-config.yml;.",
+            "--collect-all", "google.generativeai",
+            "--collect-all", "rich",
+            "--collect-all", "click",
             "--hidden-import=google.generativeai",
             "--hidden-import=rich",
             "--hidden-import=click",
@@ -712,8 +1101,7 @@ advanced_agent.log
         
         try:
             result = subprocess.run(
-                " ".join(build_cmd),
-                shell=True,
+                build_cmd,
                 capture_output=True,
                 text=True,
                 timeout=600
@@ -729,16 +1117,20 @@ advanced_agent.log
         except subprocess.TimeoutExpired:
             self.log("Build timed out", "ERROR")
             return False
+        except OSError as e:
+            self.log(f"Build could not start: {e}", "ERROR")
+            return False
             
     def validate_code_quality(self) -> bool:
         """Validate code quality after changes"""
-        python_files = list(self.root_dir.glob("*.py"))
+        python_files = self._py_files()
         
         total_quality = 0
         file_count = 0
         
-        for py_file in python_files:
-            analysis = self.advanced_code_analysis(py_file)
+        for analysis in self.analyze_files(python_files):
+            if analysis.get("skipped"):
+                continue
             quality_score = analysis.get("quality_score", 0)
             total_quality += quality_score
             file_count += 1
@@ -775,7 +1167,7 @@ advanced_agent.log
                 break
                 
         if exe_src:
-            shutil.copy2(exe_src, release_dir / "devochat_advanced.exe")
+            fast_copy(exe_src, release_dir / "devochat_advanced.exe")
         else:
             self.log("No executable found to package", "ERROR")
             return False
@@ -786,118 +1178,138 @@ advanced_agent.log
         self.log("Advanced package created", "SUCCESS")
         return True
         
-    def create_advanced_documentation(self, release_dir: Path):
-        """Create comprehensive documentation"""
-        # Create advanced README
-        readme_content = f"""# DevO Chat - Advanced Code Editor Agent Build
-
-## 🔧 Advanced Agent Features
-This executable was built by an advanced AI-powered code editor agent featuring:
-
-### 🎯 Intelligence Features
-- **Code Analysis**: Deep AST analysis with quality scoring
-- **Intelligent Fixing**: AI-powered bug detection and resolution
-- **Advanced Refactoring**: Automated code improvement
-- **Project Optimization**: Structure and organization optimization
-- **Quality Validation**: Continuous code quality monitoring
-
-### 📊 Build Statistics
-- **Files Analyzed**: {len(list(self.root_dir.glob('*.py')))}
-- **Issues Found**: {len(self.issues_found)}
-- **Fixes Applied**: {len(self.fixes_applied)}
-- **Refactoring Applied**: {len(self.refactoring_applied)}
-- **Optimizations Made**: {len(self.optimizations_made)}
-- **Build Time**: {time.time() - self.start_time:.2f} seconds
-
-### 🔧 Fixes Applied
-{chr(10).join(f"• {fix}" for fix in self.fixes_applied) if self.fixes_applied else "• No fixes needed - code was excellent!"}
-
-### 🔀 Refactoring Applied
-{chr(10).join(f"• {refactor}" for refactor in self.refactoring_applied) if self.refactoring_applied else "• No refactoring needed - code was well-structured!"}
-
-### ⚡ Optimizations Made
-{chr(10).join(f"• {opt}" for opt in self.optimizations_made) if self.optimizations_made else "• No optimizations needed - project was well-optimized!"}
-
-## 🚀 Usage
-1. Run `devochat_advanced.exe`
-2. Set environment variable: `GEMINI_API_KEY=your_key_here`
-3. Enjoy the AI-powered development experience!
-
-## 🎯 Quality Metrics
-- **Agent Type**: Advanced Code Editor Agent
-- **Intelligence Level**: Maximum
-- **Automation Level**: Fully Autonomous
-- **Code Quality**: Continuously Monitored
-- **Build Optimization**: Advanced
-
----
-*Built with ❤️ by Advanced Code Editor Agent*
-"""
+    @staticmethod
+    def _bullets(items: List[str], empty: str, prefix: str = "• ") -> str:
+        """Join items into a bullet list, or return the empty message"""
+        if not items:
+            return empty
+        return "\n".join([prefix + item for item in items])
         
-        with open(release_dir / "README.md", "w") as f:
-            f.write(readme_content)
-            
+    @classmethod
+    def _summarize(cls, items: List[str], empty: str) -> Tuple[int, str, str]:
+        """Count, README bullet block and summary bullet block for a list"""
+        return len(items), cls._bullets(items, empty), cls._bullets(items, "", "   • ")
+        
+    def _summaries(self) -> Dict[str, Tuple[int, str, str]]:
+        """Summaries of applied changes, recomputed only when the lists grow"""
+        key = (len(self.fixes_applied), len(self.refactoring_applied), len(self.optimizations_made))
+        if self._summary_cache is None or self._summary_cache[0] != key:
+            self._summary_cache = (key, {
+                "fixes": self._summarize(self.fixes_applied, "• No fixes needed - code was excellent!"),
+                "refactoring": self._summarize(self.refactoring_applied, "• No refactoring needed - code was well-structured!"),
+                "optimizations": self._summarize(self.optimizations_made, "• No optimizations needed - project was well-optimized!")
+            })
+        return self._summary_cache[1]
+        
+    def create_advanced_documentation(self, release_dir: Path, fsync: bool = False):
+        """Create comprehensive documentation
+        
+        With fsync=True each document is flushed to disk through its own write
+        descriptor before it is closed, and the release directory once after both.
+        """
+        _now = datetime.now
+        _time = time.time
+        _len = len
+        
+        build_ts = _now().isoformat()
+        py_count = _len(self._py_files())
+        n_issues = self.issue_count()
+        summaries = self._summaries()
+        n_fixes, fixes_block, _ = summaries["fixes"]
+        n_refactor, refactor_block, _ = summaries["refactoring"]
+        n_opt, opt_block, _ = summaries["optimizations"]
+        elapsed = _time() - self.start_time
+        
+        # Create advanced README; only the statistics and lists are encoded per build
+        readme_middle = "".join([
+            f"- **Files Analyzed**: {py_count}\n"
+            f"- **Issues Found**: {n_issues}\n"
+            f"- **Fixes Applied**: {n_fixes}\n"
+            f"- **Refactoring Applied**: {n_refactor}\n"
+            f"- **Optimizations Made**: {n_opt}\n"
+            f"- **Build Time**: {elapsed:.2f} seconds\n",
+            _README_FIXES_HEAD, fixes_block,
+            _README_REFACTOR_HEAD, refactor_block,
+            _README_OPT_HEAD, opt_block
+        ])
+        
+        readme_bytes = b"".join((
+            self._README_STATIC_HEAD,
+            readme_middle.encode("utf-8"),
+            self._README_STATIC_TAIL
+        ))
+
         # Create technical report
         tech_report = {
             "agent_type": "Advanced Code Editor Agent",
-            "build_timestamp": datetime.now().isoformat(),
-            "files_analyzed": len(list(self.root_dir.glob("*.py"))),
-            "issues_found": len(self.issues_found),
-            "fixes_applied": len(self.fixes_applied),
-            "refactoring_applied": len(self.refactoring_applied),
-            "optimizations_made": len(self.optimizations_made),
-            "build_time_seconds": time.time() - self.start_time,
-            "intelligence_features": [
-                "Deep AST Analysis",
-                "AI-Powered Bug Detection",
-                "Advanced Refactoring",
-                "Project Optimization",
-                "Quality Validation"
-            ],
+            "build_timestamp": build_ts,
+            "files_analyzed": py_count,
+            "issues_found": n_issues,
+            "fixes_applied": n_fixes,
+            "refactoring_applied": n_refactor,
+            "optimizations_made": n_opt,
+            "build_time_seconds": elapsed,
+            "intelligence_features": _INTELLIGENCE_FEATURES,
             "fixes_details": self.fixes_applied,
             "refactoring_details": self.refactoring_applied,
             "optimization_details": self.optimizations_made
         }
         
-        with open(release_dir / "technical_report.json", "w") as f:
-            json.dump(tech_report, f, indent=2)
+        report_bytes = json_bytes(tech_report)
+        
+        readme_path = release_dir / "README.md"
+        report_path = release_dir / "technical_report.json"
+        
+        # The two writes, and their fsyncs, are independent, so let their I/O overlap
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            readme_future = ex.submit(write_file_bytes, readme_path, readme_bytes, fsync)
+            report_future = ex.submit(write_file_bytes, report_path, report_bytes, fsync)
+            readme_future.result()
+            report_future.result()
             
+        if fsync:
+            _sync_directory(release_dir)
+            
+    @staticmethod
+    def _section(header: str, block: str) -> str:
+        """Summary section text, or nothing when the bullet block is empty"""
+        return f"{header}\n{block}\n" if block else ""
+        
     def print_summary(self):
         """Print comprehensive summary"""
-        print(f"🔍 Files analyzed: {len(list(self.root_dir.glob('*.py')))}")
-        print(f"🔧 Fixes applied: {len(self.fixes_applied)}")
-        print(f"🔀 Refactoring applied: {len(self.refactoring_applied)}")
-        print(f"⚡ Optimizations made: {len(self.optimizations_made)}")
-        print(f"📊 Issues found: {len(self.issues_found)}")
-        print("")
+        _len = len
+        summaries = self._summaries()
+        n_fixes, _, fixes_lines = summaries["fixes"]
+        n_refactor, _, refactor_lines = summaries["refactoring"]
+        n_opt, _, opt_lines = summaries["optimizations"]
         
-        if self.fixes_applied:
-            print("🔧 Applied Fixes:")
-            for fix in self.fixes_applied:
-                print(f"   • {fix}")
-                
-        if self.refactoring_applied:
-            print("🔀 Applied Refactoring:")
-            for refactor in self.refactoring_applied:
-                print(f"   • {refactor}")
-                
-        if self.optimizations_made:
-            print("⚡ Applied Optimizations:")
-            for opt in self.optimizations_made:
-                print(f"   • {opt}")
-                
-        print("")
-        print("🎯 Advanced code editor agent complete!")
+        buf = []
+        append = buf.append
+        append(f"🔍 Files analyzed: {_len(self._py_files())}\n")
+        append(f"🔧 Fixes applied: {n_fixes}\n")
+        append(f"🔀 Refactoring applied: {n_refactor}\n")
+        append(f"⚡ Optimizations made: {n_opt}\n")
+        append(f"📊 Issues found: {self.issue_count()}\n")
+        append("\n")
+        
+        append(self._section("🔧 Applied Fixes:", fixes_lines))
+        append(self._section("🔀 Applied Refactoring:", refactor_lines))
+        append(self._section("⚡ Applied Optimizations:", opt_lines))
+        
+        append("\n")
+        append("🎯 Advanced code editor agent complete!\n")
+        sys.stdout.write("".join(buf))
+        
+        if self._log_fh is not None:
+            self._log_fh.flush()
 
 def main():
     """Main entry point for advanced code editor agent"""
-    try:
-        agent = AdvancedCodeEditorAgent()
-        success = agent.run_advanced_agent()
-        sys.exit(0 if success else 1)
-    except Exception as e:
-        print(f"\n❌ Advanced agent error: {e}")
-        sys.exit(1)
+    with AdvancedCodeEditorAgent() as agent:
+        success, error = agent.run_advanced_agent_safe()
+    if error is not None:
+        print(f"\n❌ Advanced agent error: {error}")
+    sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
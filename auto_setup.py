@@ -1,22 +1,31 @@
-    from dotenv import load_dotenv
-    import argparse
+import argparse
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from rich.cells import cell_len
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.table import Table
 from rich.text import Text
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 import google.generativeai as genai
+import copy
 import json
+import mmap
 import os
+import queue
 import re
+import shlex
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import weakref
+
+from utils import json_loads
 
 #!/usr/bin/env python3
 """
@@ -26,21 +35,202 @@ Handles cloning, dependency installation, error detection, and automatic fixes
 
 
 
-# Load environment variables
+# Load environment variables; python-dotenv is optional
 try:
+    from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
-    self.log(f"Exception occurred: {e}", "ERROR")
+    pass
 
 console = Console()
 
+# Directories that never hold project sources worth checking
+_SOURCE_SKIP_DIRS = frozenset({'.git', 'node_modules', 'venv', '.venv', '__pycache__', 'dist', 'build'})
+
+def _iter_source_files(root, suffix: str, skip_dirs=_SOURCE_SKIP_DIRS, limit: Optional[int] = None):
+    """Lazily yield paths of files ending in suffix under root, stopping after limit"""
+    if limit is not None and limit <= 0:
+        return
+    
+    found = 0
+    stack = [os.fspath(root)]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in skip_dirs:
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+                        found += 1
+                        if found == limit:
+                            return
+        except OSError:
+            continue
+        # Reversed so directories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+# Matched against the undecoded bytes of a whole file
+_IMPORT_RE = re.compile(rb'^(?:from|import)\s+(\S+)', re.MULTILINE)
+# Root-level config files and the language each one indicates
+_CONFIG_FILE_LANGUAGES = {
+    'requirements.txt': 'python',
+    'pyproject.toml': 'python',
+    'setup.py': 'python',
+    'package.json': 'node',
+    'yarn.lock': 'node',
+    'pnpm-lock.yaml': 'node',
+    'Gemfile': 'ruby',
+    'composer.json': 'php',
+    'go.mod': 'go',
+    'Cargo.toml': 'rust',
+    'pom.xml': 'java',
+    'build.gradle': 'java'
+}
+
+# Python entrypoints sniffed for web framework imports
+_FRAMEWORK_ENTRYPOINTS = ('main.py', 'app.py', 'wsgi.py', 'asgi.py')
+
+# Every root-level file whose content feeds the repository analysis
+_ANALYZED_FILES = frozenset(_CONFIG_FILE_LANGUAGES).union(_FRAMEWORK_ENTRYPOINTS)
+
+_FRAMEWORK_IMPORT_RE = re.compile(rb'(?:from|import) (flask|fastapi)')
+_CODEBLOCK_RE = re.compile(r'```(?:bash|shell|cmd)?\n(.*?)\n```', re.DOTALL)
+
+_HISTORY_LIMIT = 256
+
+# Package tools an AI-suggested fix may run, and how long each may take
+_ALLOWED_FIX_COMMANDS = frozenset({'uv', 'pip', 'npm', 'yarn', 'pnpm'})
+_FIX_COMMAND_TIMEOUT = 600
+
+# Modules that never need installing; sys.stdlib_module_names is Python 3.10+
+_STDLIB_MODULES = frozenset(getattr(sys, 'stdlib_module_names', ())) | frozenset(sys.builtin_module_names) | {
+    'os', 'sys', 'json', 'datetime', 're'
+}
+
+# Seconds a single probe may run before the worker is killed
+_PY_WORKER_TIMEOUT = 120
+
+# Long-lived interpreter in the project environment: each stdin line is a JSON
+# [code, args] pair; the code runs with ARGS bound and one JSON [ok, output]
+# line is written back, so repeated probes share a single interpreter startup
+_PY_WORKER = (
+    "import contextlib, importlib, io, json, sys, traceback\n"
+    "for line in sys.stdin:\n"
+    "    code, args = json.loads(line)\n"
+    "    importlib.invalidate_caches()\n"
+    "    out = io.StringIO()\n"
+    "    ok = True\n"
+    "    try:\n"
+    "        with contextlib.redirect_stdout(out):\n"
+    "            exec(compile(code, '<devo-probe>', 'exec'), {'__name__': '__devo_probe__', 'ARGS': args})\n"
+    "    except BaseException:\n"
+    "        ok = False\n"
+    "        out.write(traceback.format_exc())\n"
+    "    sys.stdout.write(json.dumps([ok, out.getvalue()]) + '\\n')\n"
+    "    sys.stdout.flush()\n"
+)
+
+# Worker probe: prints the module names in ARGS that cannot be found,
+# without importing any of them
+_MISSING_MODULES_PROBE = (
+    "import importlib.util, json\n"
+    "missing = []\n"
+    "for name in ARGS:\n"
+    "    try:\n"
+    "        found = importlib.util.find_spec(name) is not None\n"
+    "    except (ImportError, ValueError):\n"
+    "        found = False\n"
+    "    if not found:\n"
+    "        missing.append(name)\n"
+    "print(json.dumps(missing))\n"
+)
+
+# Worker probe: prints {path: error} for the paths in ARGS that do not compile
+_SYNTAX_CHECK_PROBE = (
+    "import json, traceback\n"
+    "errors = {}\n"
+    "for path in ARGS:\n"
+    "    try:\n"
+    "        with open(path, 'rb') as f:\n"
+    "            compile(f.read(), path, 'exec', dont_inherit=True)\n"
+    "    except (SyntaxError, ValueError) as e:\n"
+    "        errors[path] = ''.join(traceback.format_exception_only(type(e), e))\n"
+    "    except OSError:\n"
+    "        pass\n"
+    "print(json.dumps(errors))\n"
+)
+
+# Templates for essential files that a cloned repository is missing
+_REQUIREMENTS_TEMPLATE = b"# Auto-generated requirements.txt\n# Add your dependencies here\n"
+_README_TEMPLATE_BODY = b"## Description\n\n## Installation\n\n## Usage\n\n"
+_GITIGNORE_BYTES = {
+    'python': b"__pycache__/\n*.pyc\n*.pyo\n*.pyd\n.Python\nbuild/\ndevelop-eggs/\ndist/\ndownloads/\neggs/\n.eggs/\nlib/\nlib64/\nparts/\nsdist/\nvar/\nwheels/\n*.egg-info/\n.installed.cfg\n*.egg\n.env\n.venv\nenv/\nvenv/\nENV/\nenv.bak/\nvenv.bak/\n",
+    'node': b"node_modules/\nnpm-debug.log*\nyarn-debug.log*\nyarn-error.log*\n.npm\n.yarn-integrity\n.env\n.env.local\n.env.development.local\n.env.test.local\n.env.production.local\ndist/\nbuild/\n"
+}
+
+def _top_level_names(repo_path) -> Set[str]:
+    """Names in the repository root, from a single directory read"""
+    try:
+        with os.scandir(repo_path) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+def _render_table(title: str, header: Tuple[str, ...], rows: List[Tuple[str, ...]]) -> str:
+    """Render a small fixed-shape table as box-drawn text"""
+    table = [header, *rows]
+    widths = [max(cell_len(row[i]) for row in table) for i in range(len(header))]
+    
+    def line(left: str, mid: str, right: str) -> str:
+        return left + mid.join('─' * (w + 2) for w in widths) + right
+    
+    def row_text(row: Tuple[str, ...]) -> str:
+        return '│' + '│'.join(
+            f" {cell}{' ' * (w - cell_len(cell))} " for cell, w in zip(row, widths)
+        ) + '│'
+    
+    out = [title.center(sum(widths) + 3 * len(widths) + 1).rstrip(),
+           line('┌', '┬', '┐'), row_text(header), line('├', '┼', '┤')]
+    out.extend(row_text(row) for row in rows)
+    out.append(line('└', '┴', '┘'))
+    return '\n'.join(out)
+
+def _stop_py_worker(worker: subprocess.Popen):
+    """Close a probe interpreter's stdin, killing it if it does not exit promptly"""
+    try:
+        worker.stdin.close()
+        worker.wait(timeout=5)
+    except (OSError, subprocess.TimeoutExpired):
+        worker.kill()
+        worker.wait()
+
 class AutoSetupManager:
     """Handles automatic repository setup, dependency correction, and error fixing"""
     
+    # Blobless partial clones need git 2.27+; probed once per process
+    _PARTIAL_CLONE_MIN_GIT = (2, 27)
+    _git_version: Optional[Tuple[int, ...]] = None
+    
     def __init__(self, api_key: str = None):
         self.api_key = api_key or os.getenv('GEMINI_API_KEY')
-        self.setup_history = []
-        self.error_fixes = []
+        # Bounded so a long-lived manager does not grow without limit
+        self.setup_history: deque = deque(maxlen=_HISTORY_LIMIT)
+        self.error_fixes: deque = deque(maxlen=_HISTORY_LIMIT)
+        # Working directory for tool subprocesses; the process cwd is never changed
+        self._repo_path: Optional[Path] = None
+        # path -> (st_mtime_ns, st_size, content), reused while the file is unchanged
+        self._file_cache: Dict[str, Tuple[int, int, str]] = {}
+        # repository fingerprint -> repo_info from _analyze_repository_structure
+        self._analyze_cache: Dict[Tuple, Dict] = {}
+        # Persistent project interpreter for probes, started on first use
+        self._py_worker: Optional[subprocess.Popen] = None
+        self._py_worker_cwd: Optional[Path] = None
+        self._py_replies: Optional[queue.Queue] = None
+        # Stops the worker when it is closed, the manager is collected or the interpreter exits
+        self._py_worker_finalizer: Optional[weakref.finalize] = None
         
         if self.api_key:
             genai.configure(api_key=self.api_key)
@@ -49,6 +239,98 @@ class AutoSetupManager:
             self.model = None
             console.print("[yellow]⚠️  No API key available. AI-powered fixes will be disabled.[/yellow]")
     
+    def _start_py_worker(self):
+        """Start the persistent interpreter and a thread feeding its replies into a queue"""
+        self._py_worker = subprocess.Popen(
+            ['uv', 'run', 'python', '-u', '-c', _PY_WORKER],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, cwd=self._repo_path
+        )
+        self._py_worker_cwd = self._repo_path
+        self._py_worker_finalizer = weakref.finalize(self, _stop_py_worker, self._py_worker)
+        # readline() cannot time out, so a reader thread does it and _run_py
+        # waits on the queue instead; None marks end of output
+        self._py_replies = queue.Queue()
+        
+        def pump(stdout, replies):
+            for line in stdout:
+                replies.put(line)
+            replies.put(None)
+            
+        threading.Thread(target=pump, args=(self._py_worker.stdout, self._py_replies), daemon=True).start()
+    
+    def _run_py(self, code: str, args=None, timeout: float = _PY_WORKER_TIMEOUT) -> Tuple[bool, str]:
+        """Run code in the project's persistent interpreter, returning (ok, output)"""
+        if self._py_worker is not None and (
+            self._py_worker.poll() is not None or self._py_worker_cwd != self._repo_path
+        ):
+            self.close_py_worker()
+        
+        # A worker that died between probes is restarted once and the probe resent
+        for attempt in range(2):
+            if self._py_worker is None:
+                self._start_py_worker()
+            
+            try:
+                self._py_worker.stdin.write(json.dumps([code, args]) + '\n')
+                self._py_worker.stdin.flush()
+                reply = self._py_replies.get(timeout=timeout)
+            except queue.Empty:
+                self._py_worker.kill()
+                self.close_py_worker()
+                return False, f"Python worker timed out after {timeout}s"
+            except OSError as e:
+                self.close_py_worker()
+                if attempt:
+                    return False, str(e)
+                continue
+            
+            if reply is None:
+                self.close_py_worker()
+                if attempt:
+                    return False, "Python worker exited"
+                continue
+            ok, output = json.loads(reply)
+            return ok, output
+    
+    def close_py_worker(self):
+        """Stop the persistent interpreter, if one is running"""
+        self._py_worker = None
+        finalizer, self._py_worker_finalizer = self._py_worker_finalizer, None
+        if finalizer is not None:
+            finalizer()
+    
+    def _read_cached(self, path: Path) -> str:
+        """Read a text file, skipping the read when its mtime and size are unchanged"""
+        st = os.stat(path)
+        key = str(path)
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._file_cache[key] = (st.st_mtime_ns, st.st_size, content)
+        return content
+    
+    def _read_config_file(self, config_path: Path) -> Tuple[Optional[str], Optional[Exception]]:
+        """Read a config file, returning (content, read error)"""
+        try:
+            return self._read_cached(config_path), None
+        except Exception as e:
+            return None, e
+    
+    def _analysis_fingerprint(self, repo_path: Path, top: Set[str]) -> Tuple:
+        """Cheap key that changes whenever anything the analysis reads changes"""
+        stats = []
+        for name in sorted(top.intersection(_ANALYZED_FILES)):
+            try:
+                st = os.stat(repo_path / name)
+                stats.append((name, st.st_mtime_ns, st.st_size))
+            except OSError:
+                stats.append((name, None, None))
+        return (str(repo_path), os.stat(repo_path).st_mtime_ns, tuple(sorted(top)), tuple(stats))
+    
     def setup_repository(self, repo_url: str, target_dir: str = None) -> bool:
     # TODO: Consider breaking this function into smaller functions
         """Automatically setup repository with dependency correction and error fixing"""
@@ -68,6 +350,7 @@ class AutoSetupManager:
             repo_path = self._clone_repository(repo_url, target_dir)
             if not repo_path:
                 return False
+            self._repo_path = Path(repo_path)
             
             # Step 2: Analyze repository structure
             repo_info = self._analyze_repository_structure(repo_path)
@@ -107,8 +390,7 @@ class AutoSetupManager:
             
             # Remove existing directory if it exists
             if target_path.exists():
-                console.print(f"[yellow]📁 Directory {target_path} already exists,
-                    removing...[/yellow]")
+                console.print(f"[yellow]📁 Directory {target_path} already exists, removing...[/yellow]")
                 shutil.rmtree(target_path)
             
             # Clone repository
@@ -120,9 +402,11 @@ class AutoSetupManager:
             ) as progress:
                 task = progress.add_task("📥 Cloning repository...", total=1)
                 
-                result = subprocess.run([
-                    'git', 'clone', repo_url, str(target_path)
-                ], capture_output=True, text=True)
+                result = subprocess.run(
+                    self._clone_command(repo_url, target_path),
+                    capture_output=True, text=True,
+                    env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
+                )
                 
                 if result.returncode != 0:
                     console.print(f"[red]❌ Git clone failed: {result.stderr}[/red]")
@@ -137,6 +421,31 @@ class AutoSetupManager:
             console.print(f"[red]❌ Clone failed: {e}[/red]")
             return None
     
+    @classmethod
+    def _get_git_version(cls) -> Tuple[int, ...]:
+        """Return the installed git version as a tuple, or () if unknown"""
+        if cls._git_version is None:
+            version = ()
+            try:
+                result = subprocess.run(['git', '--version'], capture_output=True, text=True)
+                match = re.search(r'(\d+)\.(\d+)(?:\.(\d+))?', result.stdout)
+                if match:
+                    version = tuple(int(part) for part in match.groups() if part is not None)
+            except OSError:
+                pass
+            cls._git_version = version
+        return cls._git_version
+    
+    def _clone_command(self, repo_url: str, target_path: Path) -> List[str]:
+        """Build the clone command, using a shallow blobless clone when git supports it"""
+        if self._get_git_version() >= self._PARTIAL_CLONE_MIN_GIT:
+            return [
+                'git', '-c', 'protocol.version=2', 'clone',
+                '--filter=blob:none', '--depth=1', '--single-branch', '--no-tags',
+                repo_url, str(target_path)
+            ]
+        return ['git', 'clone', repo_url, str(target_path)]
+    
     def _analyze_repository_structure(self, repo_path: str) -> Dict:
     # TODO: Consider breaking this function into smaller functions
         """Analyze repository structure and detect project type"""
@@ -154,44 +463,38 @@ class AutoSetupManager:
         try:
             repo_path = Path(repo_path)
             
-            # Check for common config files
-            config_files = {
-                'requirements.txt': 'python',
-                'pyproject.toml': 'python',
-                'setup.py': 'python',
-                'package.json': 'node',
-                'yarn.lock': 'node',
-                'pnpm-lock.yaml': 'node',
-                'Gemfile': 'ruby',
-                'composer.json': 'php',
-                'go.mod': 'go',
-                'Cargo.toml': 'rust',
-                'pom.xml': 'java',
-                'build.gradle': 'java'
-            }
-            
-            detected_languages = []
-            
-            for config_file, language in config_files.items():
-                config_path = repo_path / config_file
-                if config_path.exists():
-                    detected_languages.append(language)
-                    try:
-                        with open(config_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            repo_info['config_files'][config_file] = content
-                    except Exception as e:
-                        console.print(f"[yellow]⚠️  Could not read {config_file}: {e}[/yellow]")
-            
-            # Determine primary language
-            if detected_languages:
-                repo_info['language'] = max(set(detected_languages), key=detected_languages.count)
+            top = _top_level_names(repo_path)
+            fingerprint = self._analysis_fingerprint(repo_path, top)
+            cached = self._analyze_cache.get(fingerprint)
             
-            # Detect framework and package manager based on language
-            if repo_info['language'] == 'python':
-                repo_info.update(self._analyze_python_project(repo_path))
-            elif repo_info['language'] == 'node':
-                repo_info.update(self._analyze_node_project(repo_path))
+            if cached is not None:
+                repo_info = copy.deepcopy(cached)
+            else:
+                detected_languages = []
+                present = [name for name in _CONFIG_FILE_LANGUAGES if name in top]
+                
+                # The reads are independent, so overlap them and assemble results after the join
+                with ThreadPoolExecutor(max_workers=8) as ex:
+                    results = list(ex.map(self._read_config_file, (repo_path / name for name in present)))
+                
+                for config_file, (content, error) in zip(present, results):
+                    detected_languages.append(_CONFIG_FILE_LANGUAGES[config_file])
+                    if error is None:
+                        repo_info['config_files'][config_file] = content
+                    else:
+                        console.print(f"[yellow]⚠️  Could not read {config_file}: {error}[/yellow]")
+                
+                # Determine primary language
+                if detected_languages:
+                    repo_info['language'] = Counter(detected_languages).most_common(1)[0][0]
+                
+                # Detect framework and package manager based on language
+                if repo_info['language'] == 'python':
+                    repo_info.update(self._analyze_python_project(repo_path, top))
+                elif repo_info['language'] == 'node':
+                    repo_info.update(self._analyze_node_project(repo_path, top))
+                
+                self._analyze_cache[fingerprint] = copy.deepcopy(repo_info)
             
             console.print(f"[green]📊 Repository Analysis Complete[/green]")
             console.print(f"[cyan]Language: {repo_info['language']}[/cyan]")
@@ -204,7 +507,7 @@ class AutoSetupManager:
             console.print(f"[red]❌ Repository analysis failed: {e}[/red]")
             return repo_info
     
-    def _analyze_python_project(self, repo_path: Path) -> Dict:
+    def _analyze_python_project(self, repo_path: Path, top: Optional[Set[str]] = None) -> Dict:
     # TODO: Consider breaking this function into smaller functions
         """Analyze Python project specifics"""
         info = {
@@ -214,45 +517,55 @@ class AutoSetupManager:
             'scripts': {}
         }
         
+        if top is None:
+            top = _top_level_names(repo_path)
+        
         # Check for package managers
-        if (repo_path / 'pyproject.toml').exists():
+        if 'pyproject.toml' in top:
             info['package_manager'] = 'pip'  # Could be poetry, but we'll use pip
-        if (repo_path / 'poetry.lock').exists():
+        if 'poetry.lock' in top:
             info['package_manager'] = 'poetry'
-        if (repo_path / 'Pipfile').exists():
+        if 'Pipfile' in top:
             info['package_manager'] = 'pipenv'
         
         # Detect framework
-        if (repo_path / 'manage.py').exists():
+        if 'manage.py' in top:
             info['framework'] = 'django'
-        elif any((repo_path / 'app.py').exists(), (repo_path / 'main.py').exists()):
-            # Check for Flask imports
-            for py_file in repo_path.rglob('*.py'):
+        elif 'app.py' in top or 'main.py' in top:
+            # Check the likely entrypoints for Flask/FastAPI imports
+            for entry in _FRAMEWORK_ENTRYPOINTS:
+                if entry not in top:
+                    continue
                 try:
-                    with open(py_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        if 'from flask' in content or 'import flask' in content:
-                            info['framework'] = 'flask'
-                            break
-                        elif 'from fastapi' in content or 'import fastapi' in content:
-                            info['framework'] = 'fastapi'
-                            break
+                    with open(repo_path / entry, 'rb') as f:
+                        # One pass finds imports of either framework
+                        hits = set(_FRAMEWORK_IMPORT_RE.findall(f.read()))
+                    if b'flask' in hits:
+                        info['framework'] = 'flask'
+                        break
+                    elif b'fastapi' in hits:
+                        info['framework'] = 'fastapi'
+                        break
                 except:
                     continue
         
         # Extract dependencies
         requirements_file = repo_path / 'requirements.txt'
-        if requirements_file.exists():
+        if 'requirements.txt' in top:
             try:
+                deps = []
                 with open(requirements_file, 'r', encoding='utf-8') as f:
-                    deps = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-                    info['dependencies'] = deps
+                    for line in f:
+                        line = line.strip()
+                        if line and line[0] != '#':
+                            deps.append(line)
+                info['dependencies'] = deps
             except:
                 pass
         
         return info
     
-    def _analyze_node_project(self, repo_path: Path) -> Dict:
+    def _analyze_node_project(self, repo_path: Path, top: Optional[Set[str]] = None) -> Dict:
     # TODO: Consider breaking this function into smaller functions
         """Analyze Node.js project specifics"""
         info = {
@@ -262,18 +575,21 @@ class AutoSetupManager:
             'scripts': {}
         }
         
+        if top is None:
+            top = _top_level_names(repo_path)
+        
         # Check for package managers
-        if (repo_path / 'yarn.lock').exists():
+        if 'yarn.lock' in top:
             info['package_manager'] = 'yarn'
-        elif (repo_path / 'pnpm-lock.yaml').exists():
+        elif 'pnpm-lock.yaml' in top:
             info['package_manager'] = 'pnpm'
         
         # Analyze package.json
         package_json = repo_path / 'package.json'
-        if package_json.exists():
+        if 'package.json' in top:
             try:
-                with open(package_json, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(package_json, 'rb') as f:
+                    data = json_loads(f.read())
                     
                     # Extract dependencies
                     deps = []
@@ -307,7 +623,7 @@ class AutoSetupManager:
     # TODO: Consider breaking this function into smaller functions
         """Setup environment and install dependencies"""
         try:
-            os.chdir(repo_path)
+            self._repo_path = Path(repo_path)
             
             language = repo_info['language']
             package_manager = repo_info['package_manager']
@@ -347,26 +663,35 @@ class AutoSetupManager:
                 
                 # Initialize uv project
                 task2 = progress.add_task("🔧 Initializing uv project...", total=1)
-                subprocess.run(['uv', 'init', '--quiet'], capture_output=True)
+                subprocess.run(['uv', 'init', '--quiet'], capture_output=True, cwd=self._repo_path)
                 progress.update(task2, completed=1)
                 
                 # Install dependencies
                 task3 = progress.add_task("📦 Installing dependencies...", total=1)
                 
                 # Install from requirements.txt if exists
+                # The adds only resolve and lock; the environment is synced once afterwards
+                dependency_errors = []
                 if 'requirements.txt' in repo_info['config_files']:
                     result = subprocess.run([
-                        'uv', 'add', '--requirements', 'requirements.txt'
-                    ], capture_output=True, text=True)
+                        'uv', 'add', '--no-sync', '--requirements', 'requirements.txt'
+                    ], capture_output=True, text=True, cwd=self._repo_path)
                     
                     if result.returncode != 0:
-                        console.print(f"[yellow]⚠️  Dependency installation issues detected[/yellow]")
-                        self._fix_python_dependencies(result.stderr)
+                        dependency_errors.append(result.stderr)
                 
-                # Install common development dependencies
+                # Install common development dependencies in one resolve
                 dev_deps = ['pytest', 'black', 'flake8', 'mypy']
-                for dep in dev_deps:
-                    subprocess.run(['uv', 'add', '--dev', dep], capture_output=True)
+                subprocess.run(['uv', 'add', '--no-sync', '--dev', *dev_deps], capture_output=True, cwd=self._repo_path)
+                
+                result = subprocess.run(['uv', 'sync'], capture_output=True, text=True, cwd=self._repo_path)
+                if result.returncode != 0:
+                    dependency_errors.append(result.stderr)
+                
+                # One repair pass, after the sync, covering both failures
+                if dependency_errors:
+                    console.print(f"[yellow]⚠️  Dependency installation issues detected[/yellow]")
+                    self._fix_python_dependencies("\n".join(dependency_errors))
                 
                 progress.update(task3, completed=1)
             
@@ -407,7 +732,7 @@ class AutoSetupManager:
                 elif package_manager == 'pnpm':
                     install_cmd = ['pnpm', 'install']
                 
-                result = subprocess.run(install_cmd, capture_output=True, text=True)
+                result = subprocess.run(install_cmd, capture_output=True, text=True, cwd=self._repo_path)
                 
                 if result.returncode != 0:
                     console.print(f"[yellow]⚠️  Dependency installation issues detected[/yellow]")
@@ -504,15 +829,27 @@ class AutoSetupManager:
         """Extract and execute commands from AI response"""
         try:
             # Extract code blocks that look like commands
-            code_blocks = re.findall(r'```(?:bash|shell|cmd)?\n(.*?)\n```', ai_response, re.DOTALL)
+            code_blocks = _CODEBLOCK_RE.findall(ai_response)
             
             for block in code_blocks:
                 commands = [line.strip() for line in block.split('\n') if line.strip() and not line.startswith('#')]
                 
                 for cmd in commands:
-                    if any(cmd.startswith(prefix) for prefix in ['uv ', 'pip ', 'npm ', 'yarn ', 'pnpm ']):
+                    try:
+                        parts = shlex.split(cmd)
+                    except ValueError:
+                        continue
+                    
+                    if parts and parts[0] in _ALLOWED_FIX_COMMANDS:
                         console.print(f"[cyan]🔧 Executing: {cmd}[/cyan]")
-                        result = subprocess.run(cmd.split(), capture_output=True, text=True)
+                        try:
+                            result = subprocess.run(
+                                parts, capture_output=True, text=True,
+                                cwd=self._repo_path, timeout=_FIX_COMMAND_TIMEOUT
+                            )
+                        except subprocess.TimeoutExpired:
+                            console.print(f"[yellow]⚠️  Command timed out after {_FIX_COMMAND_TIMEOUT}s[/yellow]")
+                            continue
                         
                         if result.returncode == 0:
                             console.print(f"[green]✅ Command successful[/green]")
@@ -539,37 +876,53 @@ class AutoSetupManager:
             return
         
         try:
-            python_files = list(Path(repo_path).rglob('*.py'))
+            python_files = _iter_source_files(repo_path, '.py', limit=10)
+            candidates = set()
             
-            for py_file in python_files[:10]:  # Limit to first 10 files
+            for py_file in python_files:
                 try:
-                    with open(py_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    # Map the whole file, so late imports are seen and no
+                    # line is cut short; empty files cannot be mapped
+                    if os.path.getsize(py_file) == 0:
+                        continue
+                    with open(py_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        imports = [m.decode('utf-8', 'ignore') for m in _IMPORT_RE.findall(mm)]
                     
                     # Check for common import issues
-                    imports = re.findall(r'^(?:from|import)\s+([^\s]+)', content, re.MULTILINE)
-                    
-                    for imp in imports:
-                        if '.' not in imp and imp not in ['os', 'sys', 'json', 'datetime', 're']:
-                            # Check if package is installed
-                            result = subprocess.run([
-                                'uv', 'run', 'python', '-c', f'import {imp}'
-                            ], capture_output=True, text=True)
-                            
-                            if result.returncode != 0:
-                                console.print(f"[yellow]📦 Missing package detected: {imp}[/yellow]")
-                                # Try to install it
-                                install_result = subprocess.run([
-                                    'uv', 'add', imp
-                                ], capture_output=True, text=True)
-                                
-                                if install_result.returncode == 0:
-                                    console.print(f"[green]✅ Installed: {imp}[/green]")
-                                else:
-                                    console.print(f"[red]❌ Failed to install: {imp}[/red]")
+                    candidates.update(
+                        imp for imp in imports
+                        if '.' not in imp and imp not in _STDLIB_MODULES
+                    )
                                     
                 except Exception as e:
                     continue
+            
+            if not candidates:
+                return
+            
+            # Check every candidate package in the project interpreter
+            ok, output = self._run_py(_MISSING_MODULES_PROBE, sorted(candidates))
+            
+            if not ok:
+                console.print(f"[yellow]⚠️  Import check could not run: {output.strip()}[/yellow]")
+                return
+            
+            missing = json.loads(output.strip().splitlines()[-1])
+            if not missing:
+                return
+            
+            for imp in missing:
+                console.print(f"[yellow]📦 Missing package detected: {imp}[/yellow]")
+            
+            # Try to install them all at once
+            install_result = subprocess.run([
+                'uv', 'add', *missing
+            ], capture_output=True, text=True, cwd=self._repo_path)
+            
+            if install_result.returncode == 0:
+                console.print(f"[green]✅ Installed: {', '.join(missing)}[/green]")
+            else:
+                console.print(f"[red]❌ Failed to install: {', '.join(missing)}[/red]")
                     
         except Exception as e:
             console.print(f"[red]❌ Import error check failed: {e}[/red]")
@@ -581,17 +934,25 @@ class AutoSetupManager:
             return
         
         try:
-            python_files = list(Path(repo_path).rglob('*.py'))
+            python_files = [
+                os.path.abspath(f) for f in _iter_source_files(repo_path, '.py', limit=20)
+            ]
+            if not python_files:
+                return
             
-            for py_file in python_files[:5]:  # Limit to first 5 files
-                result = subprocess.run([
-                    'uv', 'run', 'python', '-m', 'py_compile', str(py_file)
-                ], capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    console.print(f"[red]❌ Syntax error in {py_file.name}[/red]")
-                    if self.model:
-                        self._fix_syntax_error(py_file, result.stderr)
+            # Compile every candidate in the project interpreter
+            ok, output = self._run_py(_SYNTAX_CHECK_PROBE, python_files)
+            
+            if not ok:
+                console.print(f"[yellow]⚠️  Syntax check could not run: {output.strip()}[/yellow]")
+                return
+            
+            errors = json.loads(output.strip().splitlines()[-1])
+            for file_name, error_msg in errors.items():
+                py_file = Path(file_name)
+                console.print(f"[red]❌ Syntax error in {py_file.name}[/red]")
+                if self.model:
+                    self._fix_syntax_error(py_file, error_msg)
                         
         except Exception as e:
             console.print(f"[red]❌ Syntax error check failed: {e}[/red]")
@@ -600,8 +961,7 @@ class AutoSetupManager:
     # TODO: Consider breaking this function into smaller functions
         """Fix syntax errors using AI"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = self._read_cached(file_path)
             
             prompt = f"""
             Fix this Python syntax error:
@@ -642,10 +1002,13 @@ class AutoSetupManager:
         
         repo_path = Path(repo_path)
         
-        for file_name in essential_files[language]:
-            if not (repo_path / file_name).exists():
-                console.print(f"[yellow]📄 Missing file: {file_name}[/yellow]")
-                self._create_missing_file(repo_path, file_name, repo_info)
+        missing = [name for name in essential_files[language] if not (repo_path / name).exists()]
+        for file_name in missing:
+            console.print(f"[yellow]📄 Missing file: {file_name}[/yellow]")
+        
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as ex:
+                list(ex.map(lambda name: self._create_missing_file(repo_path, name, repo_info), missing))
     
     def _create_missing_file(self, repo_path: Path, file_name: str, repo_info: Dict):
     # TODO: Consider breaking this function into smaller functions
@@ -653,28 +1016,17 @@ class AutoSetupManager:
         try:
             if file_name == 'requirements.txt' and repo_info['language'] == 'python':
                 # Create basic requirements.txt
-                with open(repo_path / file_name, 'w', encoding='utf-8') as f:
-                    f.write("# Auto-generated requirements.txt\n")
-                    f.write("# Add your dependencies here\n")
+                (repo_path / file_name).write_bytes(_REQUIREMENTS_TEMPLATE)
                     
             elif file_name == 'README.md':
                 # Create basic README
-                with open(repo_path / file_name, 'w', encoding='utf-8') as f:
-                    f.write(f"# {repo_path.name}\n\n")
-                    f.write("## Description\n\n")
-                    f.write("## Installation\n\n")
-                    f.write("## Usage\n\n")
+                (repo_path / file_name).write_bytes(
+                    f"# {repo_path.name}\n\n".encode('utf-8') + _README_TEMPLATE_BODY
+                )
                     
             elif file_name == '.gitignore':
                 # Create basic .gitignore
-                gitignore_content = {
-                    'python': "__pycache__/\n*.pyc\n*.pyo\n*.pyd\n.Python\nbuild/\ndevelop-eggs/\ndist/\ndownloads/\neggs/\n.eggs/\nlib/\nlib64/\nparts/\nsdist/\nvar/\nwheels/\n*.egg-info/\n.installed.cfg\n*.egg\n.env\n.venv\nenv/\nvenv/\nENV/\nenv.bak/\nvenv.bak/\n",
-                    'node': "node_modules/\nnpm-debug.log*\nyarn-debug.log*\nyarn-error.log*\n.npm\n.yarn-integrity\n.env\n.env.local\n.env.development.local\n.env.test.local\n.env.production.local\ndist/\nbuild/\n"
-                }
-                
-                content = gitignore_content.get(repo_info['language'], '')
-                with open(repo_path / file_name, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                (repo_path / file_name).write_bytes(_GITIGNORE_BYTES.get(repo_info['language'], b''))
             
             console.print(f"[green]✅ Created {file_name}[/green]")
             
@@ -697,7 +1049,7 @@ class AutoSetupManager:
         }
         
         try:
-            os.chdir(repo_path)
+            self._repo_path = Path(repo_path)
             
             # Try to run basic validation
             if repo_info['language'] == 'python':
@@ -720,11 +1072,9 @@ class AutoSetupManager:
         
         try:
             # Check if we can import basic modules
-            check_result = subprocess.run([
-                'uv', 'run', 'python', '-c', 'import sys; print("Python validation successful")'
-            ], capture_output=True, text=True)
+            ok, _ = self._run_py('import sys; print("Python validation successful")')
             
-            if check_result.returncode != 0:
+            if not ok:
                 result['success'] = False
                 result['errors'].append("Python environment validation failed")
             
@@ -745,7 +1095,7 @@ class AutoSetupManager:
             # Check if we can run basic commands
             check_result = subprocess.run([
                 package_manager, 'list'
-            ], capture_output=True, text=True)
+            ], capture_output=True, text=True, cwd=self._repo_path)
             
             if check_result.returncode != 0:
                 result['warnings'].append("Package list check had issues")
@@ -759,24 +1109,27 @@ class AutoSetupManager:
     def _generate_setup_report(self, repo_path: str, repo_info: Dict, validation_result: Dict):
         """Generate comprehensive setup report"""
         
-        # Create report table
-        report_table = Table(title="🎯 Auto Setup Report", show_header=True)
-        report_table.add_column("Component", style="cyan")
-        report_table.add_column("Status", style="white")
-        report_table.add_column("Details", style="dim")
-        
-        # Add rows
-        report_table.add_row("Repository", "✅ Cloned", f"Path: {repo_path}")
-        report_table.add_row("Language", "✅ Detected", repo_info['language'])
-        report_table.add_row("Framework", "✅ Detected", repo_info['framework'])
-        report_table.add_row("Dependencies", "✅ Installed", f"Package Manager: {repo_info['package_manager']}")
+        lang = repo_info['language']
+        fw = repo_info['framework']
+        pm = repo_info['package_manager']
+        dep_n = len(repo_info['dependencies'])
         
+        # Fixed-shape report, rendered as plain text rather than through Rich's table layout
+        rows = [
+            ("Repository", "✅ Cloned", f"Path: {repo_path}"),
+            ("Language", "✅ Detected", lang),
+            ("Framework", "✅ Detected", fw),
+            ("Dependencies", "✅ Installed", f"Package Manager: {pm}"),
+        ]
         if validation_result['success']:
-            report_table.add_row("Validation", "✅ Passed", "Environment ready")
+            rows.append(("Validation", "✅ Passed", "Environment ready"))
         else:
-            report_table.add_row("Validation", "❌ Failed", f"Errors: {len(validation_result['errors'])}")
+            rows.append(("Validation", "❌ Failed", f"Errors: {len(validation_result['errors'])}"))
         
-        console.print(report_table)
+        console.print(
+            _render_table("🎯 Auto Setup Report", ("Component", "Status", "Details"), rows),
+            markup=False, highlight=False, soft_wrap=True
+        )
         
         # Show next steps
         next_steps = f"""
@@ -788,10 +1141,10 @@ class AutoSetupManager:
 4. **Chat with DevO**: Use `uv run python chat.py` for AI assistance
 
 **📁 Project Structure:**
-- Language: {repo_info['language']}
-- Framework: {repo_info['framework']}
-- Package Manager: {repo_info['package_manager']}
-- Dependencies: {len(repo_info['dependencies'])} packages
+- Language: {lang}
+- Framework: {fw}
+- Package Manager: {pm}
+- Dependencies: {dep_n} packages
 
 **🤖 AI Assistant Available:**
 Your repository is now ready for development with AI-powered assistance!
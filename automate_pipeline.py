@@ -1,12 +1,18 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-import json
+import argparse
+import hashlib
 import os
 import shutil
 import subprocess
 import sys
 import time
 
+from utils import fast_copy, force_rmtree, json_bytes, user_cache_dir, write_file_bytes
+
 #!/usr/bin/env python3
 """
 DevO Chat - CI/CD Pipeline Automation
@@ -14,13 +20,80 @@ Comprehensive automation for build, test, and deployment
 """
 
 
+@lru_cache(maxsize=None)
+def _probe(command: tuple):
+    """Run a side-effect-free command once per process, returning (returncode, stdout)"""
+    try:
+        result = subprocess.run(list(command), capture_output=True, text=True)
+    except OSError:
+        return -1, ""
+    return result.returncode, result.stdout.strip()
+
+# Imports each module named in argv, reporting every failure rather than
+# stopping at the first one
+_IMPORT_SWEEP = (
+    "import importlib, sys, traceback\n"
+    "failed = []\n"
+    "for name in sys.argv[1:]:\n"
+    "    try:\n"
+    "        importlib.import_module(name)\n"
+    "    except Exception:\n"
+    "        failed.append(name)\n"
+    "        print(f'FAILED {name}:')\n"
+    "        traceback.print_exc(file=sys.stdout)\n"
+    "print('OK' if not failed else 'Failed imports: ' + ', '.join(failed))\n"
+    "sys.exit(1 if failed else 0)\n"
+)
+
+# Build cache entries are only trusted once this marker has been written
+_CACHE_COMPLETE_MARKER = ".complete"
+_BUILD_CACHE_KEEP = 3
+
+# Files packed into the zipapp; chat.py is the entry point. Third-party
+# dependencies are not included, since compiled ones (grpc, pydantic-core)
+# cannot be imported from a zip
+_APP_FILES = ("chat.py", "templates.py", "utils.py", "auto_setup.py", "repocontainerizer.py",
+              "sample-config.yml")
+
+# Release launcher for the zipapp, preferring a Python shipped alongside it
+_ZIPAPP_LAUNCHER = (
+    "@echo off\r\n"
+    "if exist \"%~dp0python\\python.exe\" (\r\n"
+    "    \"%~dp0python\\python.exe\" \"%~dp0devochat.pyz\" %*\r\n"
+    ") else (\r\n"
+    "    python \"%~dp0devochat.pyz\" %*\r\n"
+    ")\r\n"
+).encode("ascii")
+
+def _runtime_requirements(pyproject):
+    """The [project] dependencies from pyproject.toml, or None without tomllib (Python < 3.11)"""
+    try:
+        import tomllib
+    except ImportError:
+        return None
+    with open(pyproject, "rb") as f:
+        return tomllib.load(f).get("project", {}).get("dependencies", [])
+
+def _bare_python():
+    """The interpreter outside any virtual environment, as the release launcher would find it"""
+    return getattr(sys, "_base_executable", None) or sys.executable
+
 class DevOPipeline:
-    def __init__(self):
+    def __init__(self, use_zipapp=False):
         self.root_dir = Path.cwd()
         self.build_dir = self.root_dir / "build"
         self.dist_dir = self.root_dir / "dist"
+        # PyInstaller --onedir output: the executable plus its unpacked runtime
+        self.bundle_dir = self.dist_dir / "devochat"
+        self.zipapp_path = self.dist_dir / "devochat.pyz"
+        # PyInstaller is the default build; the zipapp needs a Python with the
+        # dependencies installed, so it is opt-in
+        self.use_zipapp = use_zipapp
+        self.build_cache_dir = user_cache_dir("devo-pyinstaller")
         self.release_dir = self.root_dir / "release"
         self.start_time = time.time()
+        # Set once the environment is synced, so stages skip `uv run` resolution
+        self.venv_python = None
         
     def log(self, message, level="INFO"):
         """Log messages with timestamp"""
@@ -28,37 +101,56 @@ class DevOPipeline:
         prefix = "✅" if level == "SUCCESS" else "❌" if level == "ERROR" else "ℹ️"
         print(f"[{timestamp}] {prefix} {message}")
         
-    def run_command(self, command, description=""):
-        """Execute command with error handling"""
+    def run_command(self, command, description="", env=None):
+        """Execute an argv list directly, without an intermediate shell"""
         if description:
             self.log(f"Running: {description}")
         
+        # Stream the merged output and keep only its tail for error reports,
+        # rather than buffering everything a long build prints
+        tail = deque(maxlen=200)
         try:
-            result = subprocess.run(
+            with subprocess.Popen(
                 command,
-                shell=True,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
                 text=True,
-                check=True
-            )
-            return result.returncode == 0
-        except subprocess.CalledProcessError as e:
+                errors="replace",
+                env=env
+            ) as proc:
+                for line in proc.stdout:
+                    tail.append(line)
+                returncode = proc.wait()
+        except OSError as e:
             self.log(f"Command failed: {e}", "ERROR")
-            self.log(f"stdout: {e.stdout}", "ERROR")
-            self.log(f"stderr: {e.stderr}", "ERROR")
             return False
             
+        if returncode != 0:
+            self.log(f"Command failed: {subprocess.list2cmdline(command)} exited with status {returncode}", "ERROR")
+            self.log(f"output:\n{''.join(tail)}", "ERROR")
+            return False
+        return True
+            
+    def python_command(self):
+        """Interpreter argv for the project environment"""
+        if self.venv_python is not None:
+            return [str(self.venv_python)]
+        return ["uv", "run", "python"]
+            
     def check_prerequisites(self):
         """Check if all required tools are available"""
         self.log("Checking prerequisites...")
         
         # Check UV
-        if not self.run_command("uv --version", "Checking UV"):
+        self.log("Running: Checking UV")
+        if _probe(("uv", "--version"))[0] != 0:
             self.log("UV package manager not found!", "ERROR")
             return False
             
         # Check Python
-        if not self.run_command("python --version", "Checking Python"):
+        self.log("Running: Checking Python")
+        if _probe(("python", "--version"))[0] != 0:
             self.log("Python not found!", "ERROR")
             return False
             
@@ -69,8 +161,21 @@ class DevOPipeline:
         """Setup Python environment with all dependencies"""
         self.log("Setting up environment...")
         
-        if not self.run_command("uv sync --extra build", "Installing dependencies"):
-            return False
+        # Hardlink from uv's cache and compile bytecode once at install time
+        env = {**os.environ, "UV_LINK_MODE": "hardlink", "UV_COMPILE_BYTECODE": "1"}
+        sync = ["uv", "sync", "--extra", "build", "--no-progress"]
+        
+        # --frozen installs straight from uv.lock without re-resolving
+        if not self.run_command([*sync, "--frozen"], "Installing dependencies", env=env):
+            self.log("Locked install failed, re-locking dependencies...")
+            if not (self.run_command(["uv", "lock", "--no-progress"], "Locking dependencies", env=env)
+                    and self.run_command(sync, "Installing dependencies", env=env)):
+                return False
+            
+        venv_dir = self.root_dir / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
+        venv_python = venv_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        if venv_python.exists():
+            self.venv_python = venv_python
             
         self.log("Environment setup complete", "SUCCESS")
         return True
@@ -87,9 +192,13 @@ class DevOPipeline:
             "repocontainerizer.py"
         ]
         
-        for file in files_to_check:
-            if not self.run_command(f"uv run python -m py_compile {file}", f"Checking {file}"):
-                return False
+        # One interpreter compiles every file; compileall keeps going past a
+        # failure and names each file it could not compile
+        if not self.run_command(
+            [*self.python_command(), "-m", "compileall", "-q", *files_to_check],
+            f"Compiling {len(files_to_check)} files"
+        ):
+            return False
                 
         self.log("Code quality checks passed", "SUCCESS")
         return True
@@ -99,16 +208,19 @@ class DevOPipeline:
         self.log("Running functionality tests...")
         
         tests = [
-            ("import chat", "Chat module"),
-            ("import auto_setup", "Auto setup module"),
-            ("import utils", "Utils module"),
-            ("import templates", "Templates module"),
-            ("import repocontainerizer", "Containerizer module")
+            ("chat", "Chat module"),
+            ("auto_setup", "Auto setup module"),
+            ("utils", "Utils module"),
+            ("templates", "Templates module"),
+            ("repocontainerizer", "Containerizer module")
         ]
         
-        for test_code, description in tests:
-            if not self.run_command(f'uv run python -c "{test_code}"', description):
-                return False
+        # Import every module in one interpreter, so shared dependencies load once
+        if not self.run_command(
+            [*self.python_command(), "-c", _IMPORT_SWEEP, *(module for module, _ in tests)],
+            ", ".join(description for _, description in tests)
+        ):
+            return False
                 
         self.log("Functionality tests passed", "SUCCESS")
         return True
@@ -120,7 +232,7 @@ class DevOPipeline:
         dirs_to_clean = [self.build_dir, self.dist_dir]
         for dir_path in dirs_to_clean:
             if dir_path.exists():
-                shutil.rmtree(dir_path)
+                force_rmtree(dir_path)
                 
         # Clean spec files
         for spec_file in self.root_dir.glob("*.spec"):
@@ -130,27 +242,64 @@ class DevOPipeline:
         return True
         
     def build_executable(self):
+        """Build the distributable, with PyInstaller or as a zipapp"""
+        if self.use_zipapp:
+            return self.build_zipapp()
+        return self.build_pyinstaller_bundle()
+        
+    def build_zipapp(self):
+        """Pack the application modules into a precompiled .pyz zipapp (dependencies not included)"""
+        self.log("Building zipapp...")
+        
+        staging = self.build_dir / "zipapp"
+        if staging.exists():
+            force_rmtree(staging)
+        staging.mkdir(parents=True)
+        for name in _APP_FILES:
+            fast_copy(self.root_dir / name, staging / name)
+        self.dist_dir.mkdir(exist_ok=True)
+        
+        # -b writes chat.pyc next to chat.py, where zipimport looks for it;
+        # an interpreter with a different bytecode version falls back to the source
+        if not self.run_command([*self.python_command(), "-m", "compileall", "-q", "-b", str(staging)],
+                                "Precompiling modules"):
+            return False
+            
+        command = [
+            *self.python_command(), "-m", "zipapp", str(staging),
+            "-p", "/usr/bin/env python3",
+            "-o", str(self.zipapp_path),
+            "-c",
+            "--main", "chat:main"
+        ]
+        if not self.run_command(command, "Building zipapp"):
+            return False
+            
+        self.log("Zipapp build complete", "SUCCESS")
+        return True
+        
+    def build_pyinstaller_bundle(self):
     # TODO: Consider breaking this function into smaller functions
         """Build standalone executable using PyInstaller"""
         self.log("Building standalone executable...")
         
         command = [
-            "uv run pyinstaller",
-            "--onefile",
+            *self.python_command(), "-m", "PyInstaller",
+            "--onedir",
             "--console", 
-            "--name devochat",
-            "--add-data sample-config.yml;.",
-            "--add-data templates.py;.",
-            "--add-data utils.py;.",
-            "--add-data auto_setup.py;.",
-            "--add-data repocontainerizer.py;.",
-            "--collect-all google.generativeai",
-            "--collect-all rich",
-            "--collect-all click",
-            "--collect-all yaml",
-            "--collect-all requests",
-            "--collect-all git",
-            "--collect-all dotenv",
+            "--name", "devochat",
+            "--add-data", "sample-config.yml;.",
+            "--add-data", "templates.py;.",
+            "--add-data", "utils.py;.",
+            "--add-data", "auto_setup.py;.",
+            "--add-data", "repocontainerizer.py;.",
+            "--collect-all", "google.generativeai",
+            "--collect-all", "rich",
+            "--collect-all", "click",
+            "--collect-all", "yaml",
+            "--collect-all", "requests",
+            "--collect-all", "git",
+            "--collect-all", "dotenv",
             "--hidden-import=google.generativeai",
             "--hidden-import=rich",
             "--hidden-import=click",
@@ -166,23 +315,98 @@ class DevOPipeline:
             "chat.py"
         ]
         
-        if not self.run_command(" ".join(command), "Building executable"):
+        # Compress the bundled binaries when UPX is installed
+        upx = shutil.which("upx")
+        if upx:
+            command[-1:-1] = ["--upx-dir", os.path.dirname(upx)]
+            
+        # Reuse the bundle from an earlier build with identical inputs
+        cache_entry = self.build_cache_dir / self._build_cache_key(command)
+        marker = cache_entry / _CACHE_COMPLETE_MARKER
+        if marker.exists():
+            shutil.copytree(cache_entry / "devochat", self.bundle_dir, copy_function=fast_copy, dirs_exist_ok=True)
+            # Bump the marker so eviction keeps recently used bundles
+            os.utime(marker)
+            self.log("Executable restored from build cache", "SUCCESS")
+            return True
+            
+        # Keep PyInstaller's analysis work outside build/ so it survives cleanup
+        command[-1:-1] = ["--workpath", str(self.build_cache_dir / "work")]
+        if not self.run_command(command, "Building executable"):
             return False
             
+        self._store_build_cache(cache_entry)
         self.log("Executable build complete", "SUCCESS")
         return True
         
+    def _store_build_cache(self, cache_entry):
+        """Publish the fresh bundle under cache_entry, then evict old entries"""
+        # Copy beside the entry and rename it into place, so a crash or a
+        # concurrent build never leaves a half-copied bundle under the key
+        staging = cache_entry.with_name(f".{cache_entry.name}.{os.getpid()}.tmp")
+        try:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(self.bundle_dir, staging / "devochat", copy_function=fast_copy)
+            (staging / _CACHE_COMPLETE_MARKER).touch()
+            if cache_entry.exists():
+                force_rmtree(cache_entry)
+            os.rename(staging, cache_entry)
+        except OSError as e:
+            self.log(f"Could not update build cache: {e}")
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+            
+        self._evict_build_cache()
+        
+    def _evict_build_cache(self):
+        """Keep only the most recently used cached bundles"""
+        entries = []
+        with os.scandir(self.build_cache_dir) as it:
+            for entry in it:
+                if entry.name == "work" or entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    entries.append((os.stat(os.path.join(entry.path, _CACHE_COMPLETE_MARKER)).st_mtime, entry.path))
+                except OSError:
+                    # No marker: left behind by an interrupted build
+                    entries.append((0.0, entry.path))
+                    
+        entries.sort(reverse=True)
+        for _, path in entries[_BUILD_CACHE_KEEP:]:
+            shutil.rmtree(path, ignore_errors=True)
+            
+    def _build_cache_key(self, command):
+        """Hash of the build command and every file that goes into the bundle"""
+        digest = hashlib.sha256("\0".join(command).encode("utf-8"))
+        for name in ("uv.lock", "chat.py", "sample-config.yml", "templates.py",
+                     "utils.py", "auto_setup.py", "repocontainerizer.py"):
+            path = self.root_dir / name
+            if path.exists():
+                digest.update(name.encode("utf-8"))
+                digest.update(path.read_bytes())
+        return digest.hexdigest()[:16]
+        
     def test_executable(self):
         """Test the built executable"""
-        self.log("Testing standalone executable...")
+        self.log("Testing zipapp..." if self.use_zipapp else "Testing standalone executable...")
         
-        exe_path = self.dist_dir / "devochat.exe"
+        if self.use_zipapp:
+            exe_path = self.zipapp_path
+            # Not the build venv: -I also keeps the source tree and user site off
+            # sys.path, so only what the archive and the interpreter provide is used
+            command = [_bare_python(), "-I", str(exe_path), "--help"]
+        else:
+            exe_path = self.bundle_dir / "devochat.exe"
+            command = [str(exe_path), "--help"]
+            
         if not exe_path.exists():
             self.log("Executable not found!", "ERROR")
             return False
             
         # Test help command
-        if not self.run_command(f'"{exe_path}" --help', "Testing help command"):
+        if not self.run_command(command, "Testing help command"):
+            if self.use_zipapp:
+                self.log("The zipapp needs DevO Chat's dependencies installed in the Python that runs it", "ERROR")
             return False
             
         self.log("Executable tests passed", "SUCCESS")
@@ -197,43 +421,85 @@ class DevOPipeline:
             shutil.rmtree(self.release_dir)
         self.release_dir.mkdir()
         
-        # Copy executable
-        exe_src = self.dist_dir / "devochat.exe"
-        exe_dst = self.release_dir / "devochat.exe"
-        shutil.copy2(exe_src, exe_dst)
+        copies = []
+        requirements = None
+        if self.use_zipapp:
+            exe_dst = self.release_dir / "devochat.pyz"
+            launcher = "devochat.bat"
+            copies.append((self.zipapp_path, exe_dst))
+            write_file_bytes(self.release_dir / launcher, _ZIPAPP_LAUNCHER)
+            requirements = _runtime_requirements(self.root_dir / "pyproject.toml")
+            if requirements is not None:
+                write_file_bytes(self.release_dir / "requirements.txt",
+                                  "".join(f"{req}\n" for req in requirements).encode("utf-8"))
+        else:
+            # Executable bundle, flattened into the release root next to the launcher
+            exe_dst = self.release_dir / "devochat.exe"
+            launcher = "launch_devochat.bat"
         
-        # Copy documentation and config
-        files_to_copy = [
-            "STANDALONE_EXECUTABLE_GUIDE.md",
-            "sample-config.yml",
-            "launch_devochat.bat"
-        ]
+        # Documentation and config; the executable guide does not apply to the zipapp
+        files_to_copy = ["sample-config.yml"]
+        if not self.use_zipapp:
+            files_to_copy += ["STANDALONE_EXECUTABLE_GUIDE.md", launcher]
         
         for file in files_to_copy:
             src = self.root_dir / file
             if src.exists():
-                shutil.copy2(src, self.release_dir / file)
+                copies.append((src, self.release_dir / file))
+                
+        # Issue every copy at once so the large executable and the small
+        # files overlap instead of queueing behind each other
+        with ThreadPoolExecutor(max_workers=len(copies) + 1) as ex:
+            futures = [ex.submit(fast_copy, src, dst) for src, dst in copies]
+            if not self.use_zipapp:
+                futures.append(ex.submit(shutil.copytree, self.bundle_dir, self.release_dir,
+                                         copy_function=fast_copy, dirs_exist_ok=True))
+            for future in futures:
+                future.result()
                 
         # Create version info
         version_info = {
             "build_date": datetime.now().isoformat(),
             "python_version": "3.11.9",
             "uv_version": "0.7.19",
-            "pyinstaller_version": "6.14.2",
+            "build_type": "zipapp" if self.use_zipapp else "pyinstaller",
+            "pyinstaller_version": None if self.use_zipapp else "6.14.2",
             "file_size": exe_dst.stat().st_size,
             "build_time": time.time() - self.start_time
         }
         
-        with open(self.release_dir / "version.json", "w") as f:
-            json.dump(version_info, f, indent=2)
+        write_file_bytes(self.release_dir / "version.json", json_bytes(version_info))
+            
+        if self.use_zipapp:
+            title = "Python Zipapp Release"
+            setup = (
+                "1. Install Python 3.9+ and DevO Chat's dependencies: "
+                "`python -m pip install -r requirements.txt`\n"
+                f"2. Run `python {exe_dst.name}` or use `{launcher}`\n"
+            )
+            included = (
+                "- `devochat.pyz` - DevO Chat application code (dependencies not included)\n"
+                "- `devochat.bat` - Launcher, uses `python\\python.exe` when present\n"
+                + ("- `requirements.txt` - Dependencies to install\n" if requirements is not None else "")
+            ).rstrip("\n")
+            next_step = 3
+        else:
+            title = "Standalone Release"
+            setup = f"1. Run `{exe_dst.name}` or use `{launcher}`\n"
+            included = (
+                "- `devochat.exe` - Main executable\n"
+                "- `_internal/` - Bundled runtime used by the executable\n"
+                "- `launch_devochat.bat` - Easy launcher\n"
+                "- `STANDALONE_EXECUTABLE_GUIDE.md` - User guide"
+            )
+            next_step = 2
             
         # Create README for release
-        readme_content = f"""# DevO Chat - Standalone Release
+        readme_content = f"""# DevO Chat - {title}
 
 ## Quick Start
-1. Run `devochat.exe` or use `launch_devochat.bat`
-2. Set your Gemini API key as environment variable: `GEMINI_API_KEY`
-3. Start chatting with the AI assistant!
+{setup}{next_step}. Set your Gemini API key as environment variable: `GEMINI_API_KEY`
+{next_step + 1}. Start chatting with the AI assistant!
 
 ## Build Information
 - Build Date: {version_info['build_date']}
@@ -241,9 +507,7 @@ class DevOPipeline:
 - Build Time: {version_info['build_time']:.2f} seconds
 
 ## Files Included
-- `devochat.exe` - Main executable
-- `launch_devochat.bat` - Easy launcher
-- `STANDALONE_EXECUTABLE_GUIDE.md` - User guide
+{included}
 - `sample-config.yml` - Configuration template
 - `version.json` - Build information
 
@@ -261,8 +525,7 @@ class DevOPipeline:
 Ready for distribution! 🚀
 """
         
-        with open(self.release_dir / "README.md", "w") as f:
-            f.write(readme_content)
+        write_file_bytes(self.release_dir / "README.md", readme_content.encode("utf-8"))
             
         self.log("Distribution package created", "SUCCESS")
         return True
@@ -272,22 +535,50 @@ Ready for distribution! 🚀
         """Execute the complete automation pipeline"""
         self.log("🚀 Starting DevO Chat Automation Pipeline")
         
-        stages = [
-            ("Prerequisites Check", self.check_prerequisites),
-            ("Environment Setup", self.setup_environment),
-            ("Code Quality Checks", self.run_quality_checks),
-            ("Functionality Tests", self.run_functionality_tests),
-            ("Build Cleanup", self.clean_build),
-            ("Executable Build", self.build_executable),
-            ("Executable Tests", self.test_executable),
-            ("Distribution Package", self.create_distribution_package)
-        ]
+        # name -> (label, stage, names of the stages it needs first)
+        stages = {
+            "prereq": ("Prerequisites Check", self.check_prerequisites, set()),
+            # Cleanup deletes build/ and dist/, so it finishes before anything that writes there
+            "clean": ("Build Cleanup", self.clean_build, set()),
+            "env": ("Environment Setup", self.setup_environment, {"prereq", "clean"}),
+            "quality": ("Code Quality Checks", self.run_quality_checks, {"env"}),
+            "tests": ("Functionality Tests", self.run_functionality_tests, {"env"}),
+            "build": ("Executable Build", self.build_executable, {"env", "quality", "tests", "clean"}),
+            "exe_tests": ("Executable Tests", self.test_executable, {"build"}),
+            "package": ("Distribution Package", self.create_distribution_package, {"exe_tests"})
+        }
         
-        for i, (stage_name, stage_func) in enumerate(stages, 1):
-            self.log(f"[{i}/{len(stages)}] {stage_name}")
-            if not stage_func():
-                self.log(f"Pipeline failed at: {stage_name}", "ERROR")
-                return False
+        # Start every stage whose dependencies have passed, so independent
+        # stages overlap; after a failure nothing new starts
+        pending = dict(stages)
+        passed = set()
+        running = {}
+        failed_stage = None
+        started = 0
+        
+        with ThreadPoolExecutor(max_workers=len(stages)) as ex:
+            while True:
+                if failed_stage is None:
+                    for name in [n for n, (_, _, deps) in pending.items() if deps <= passed]:
+                        stage_name, stage_func, _ = pending.pop(name)
+                        started += 1
+                        self.log(f"[{started}/{len(stages)}] {stage_name}")
+                        running[ex.submit(stage_func)] = (name, stage_name)
+                        
+                if not running:
+                    break
+                    
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name, stage_name = running.pop(future)
+                    if future.result():
+                        passed.add(name)
+                    elif failed_stage is None:
+                        failed_stage = stage_name
+                        
+        if failed_stage is not None:
+            self.log(f"Pipeline failed at: {failed_stage}", "ERROR")
+            return False
                 
         total_time = time.time() - self.start_time
         self.log(f"🎉 Pipeline completed successfully in {total_time:.2f} seconds!", "SUCCESS")
@@ -296,7 +587,13 @@ Ready for distribution! 🚀
 
 def main():
     """Main entry point"""
-    pipeline = DevOPipeline()
+    parser = argparse.ArgumentParser(description="DevO Chat build pipeline")
+    parser.add_argument("--zipapp", action="store_true",
+                        help="Build a .pyz zipapp, which needs a Python with the dependencies "
+                             "installed, instead of a PyInstaller executable")
+    args = parser.parse_args()
+    
+    pipeline = DevOPipeline(use_zipapp=args.zipapp)
     success = pipeline.run_full_pipeline()
     sys.exit(0 if success else 1)
 
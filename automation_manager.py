@@ -1,7 +1,9 @@
-    import argparse
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import asyncio
 import json
 import os
 import shutil
@@ -9,11 +11,53 @@ import subprocess
 import sys
 import time
 
+from utils import fast_copy, json_bytes, json_loads, sha256_file, tool_available
+
 """
 DevO Chat - Development Automation Tools
 Provides automation utilities for development workflow
 """
 
+# Compiles and imports everything named in argv[1] inside one interpreter,
+# printing a JSON map of name -> True or error message as its last line
+_CHECK_SCRIPT = (
+    "import importlib, json, py_compile, sys\n"
+    "files, modules = json.loads(sys.argv[1])\n"
+    "out = {'compile': {}, 'import': {}}\n"
+    "for f in files:\n"
+    "    try:\n"
+    "        py_compile.compile(f, doraise=True)\n"
+    "        out['compile'][f] = True\n"
+    "    except (Exception, SystemExit) as e:\n"
+    "        out['compile'][f] = str(e)\n"
+    "for m in modules:\n"
+    "    try:\n"
+    "        importlib.import_module(m)\n"
+    "        out['import'][m] = True\n"
+    "    except (Exception, SystemExit) as e:\n"
+    "        out['import'][m] = f'{type(e).__name__}: {e}'\n"
+    "print(json.dumps(out))\n"
+)
+
+# Keep Windows from allocating a console window for every child process
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Only this much of each stream is kept; build logs can run to many MB
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+async def _read_tail(stream, limit: int = _OUTPUT_TAIL_BYTES) -> str:
+    """Drain a subprocess pipe, keeping only its last `limit` bytes"""
+    tail = bytearray()
+    while True:
+        chunk = await stream.read(limit)
+        if not chunk:
+            break
+        tail += chunk
+        if len(tail) > limit:
+            del tail[:-limit]
+    return tail.decode(errors="replace")
+
 
 class AutomationManager:
     """Manages various automation tasks for DevO Chat"""
@@ -26,8 +70,8 @@ class AutomationManager:
         """Load automation configuration"""
         config_file = self.root_dir / "automation_config.json"
         if config_file.exists():
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                return json_loads(f.read())
         return self.get_default_config()
         
     def get_default_config(self) -> Dict:
@@ -53,38 +97,50 @@ class AutomationManager:
     def save_config(self):
         """Save current configuration"""
         config_file = self.root_dir / "automation_config.json"
-        with open(config_file, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        with open(config_file, 'wb') as f:
+            f.write(json_bytes(self.config))
             
-    def execute_command(self, command: str, description: str = "") -> Tuple[bool, str]:
-    # TODO: Consider breaking this function into smaller functions
-        """Execute shell command with error handling"""
+    def execute_command(self, command: List[str], description: str = "") -> Tuple[bool, str]:
+        """Execute a command (argv list, no shell) with error handling"""
+        return asyncio.run(self._exec(command))
+        
+    async def _exec(self, command: List[str], timeout: int = 300) -> Tuple[bool, str]:
+        """Run a command, streaming its output into bounded buffers"""
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=300  # 5 minutes timeout
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                creationflags=_CREATION_FLAGS
             )
-            
-            if result.returncode == 0:
-                return True, result.stdout
-            else:
-                return False, result.stderr
-                
-        except subprocess.TimeoutExpired:
-            return False, "Command timed out"
         except Exception as e:
             return False, str(e)
             
+        try:
+            stdout, stderr, returncode = await asyncio.wait_for(
+                asyncio.gather(_read_tail(proc.stdout), _read_tail(proc.stderr), proc.wait()),
+                timeout  # 5 minutes by default
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, "Command timed out"
+            
+        if returncode == 0:
+            return True, stdout
+        else:
+            return False, stderr
+            
+    async def _exec_all(self, commands: List[List[str]]) -> List[Tuple[bool, str]]:
+        """Run several commands concurrently on one event loop"""
+        return await asyncio.gather(*(self._exec(command) for command in commands))
+            
     def validate_environment(self) -> bool:
         """Validate that all required tools are available"""
         required_tools = ["uv", "python", "git"]
         
         for tool in required_tools:
-            success, _ = self.execute_command(f"{tool} --version")
-            if not success:
+            if not tool_available(tool, lambda argv: self.execute_command(argv)[0]):
                 print(f"❌ {tool} not found")
                 return False
                 
@@ -96,14 +152,14 @@ class AutomationManager:
         print("🔧 Setting up development environment...")
         
         # Install dependencies
-        success, output = self.execute_command("uv sync --extra build --extra dev")
+        success, output = self.execute_command(["uv", "sync", "--extra", "build", "--extra", "dev"])
         if not success:
             print(f"❌ Failed to install dependencies: {output}")
             return False
             
         # Install pre-commit hooks if available
         if (self.root_dir / ".pre-commit-config.yaml").exists():
-            success, _ = self.execute_command("uv run pre-commit install")
+            success, _ = self.execute_command(["uv", "run", "pre-commit", "install"])
             if success:
                 print("✅ Pre-commit hooks installed")
                 
@@ -115,27 +171,38 @@ class AutomationManager:
         """Run comprehensive automated tests"""
         print("🧪 Running automated tests...")
         
-        test_results = []
+        files = []
+        modules = []
         
         # Code quality tests
         if self.config["testing"]["run_code_quality"]:
             files = ["chat.py", "auto_setup.py", "utils.py", "templates.py", "repocontainerizer.py"]
-            for file in files:
-                success, output = self.execute_command(f"uv run python -m py_compile {file}")
-                test_results.append((f"Compile {file}", success, output))
                 
         # Functionality tests
         if self.config["testing"]["run_functionality_tests"]:
             modules = ["chat", "auto_setup", "utils", "templates", "repocontainerizer"]
-            for module in modules:
-                success, output = self.execute_command(f'uv run python -c "import {module}"')
-                test_results.append((f"Import {module}", success, output))
                 
+        # Compile and import checks share one interpreter
+        tests = []
+        if files or modules:
+            check_command = ["uv", "run", "python", "-c", _CHECK_SCRIPT, json.dumps([files, modules])]
+            tests.append(("checks", check_command))
+            
         # Integration tests
         if self.config["testing"]["run_integration_tests"]:
             if (self.root_dir / "test_integration.py").exists():
-                success, output = self.execute_command("uv run python test_integration.py")
-                test_results.append(("Integration tests", success, output))
+                tests.append(("Integration tests", ["uv", "run", "python", "test_integration.py"]))
+                
+        # The compile/import batch and the integration run are separate
+        # interpreters, so run them side by side
+        outcomes = asyncio.run(self._exec_all([command for _, command in tests]))
+            
+        test_results = []
+        for (name, _), (success, output) in zip(tests, outcomes):
+            if name == "checks":
+                test_results.extend(self._parse_check_results(files, modules, success, output))
+            else:
+                test_results.append((name, success, output))
                 
         # Report results
         passed = sum(1 for _, success, _ in test_results if success)
@@ -151,6 +218,28 @@ class AutomationManager:
                 
         return passed == total
         
+    def _parse_check_results(self, files: List[str], modules: List[str], success: bool,
+                             output: str) -> List[Tuple[str, bool, str]]:
+        """Turn the _CHECK_SCRIPT JSON map into per-file and per-module test results"""
+        try:
+            checks = json_loads(output.strip().splitlines()[-1]) if success else None
+        except (ValueError, IndexError):
+            checks = None
+            
+        if checks is None:
+            # The batch itself did not run; every check inherits its error
+            return ([(f"Compile {file}", False, output) for file in files] +
+                    [(f"Import {module}", False, output) for module in modules])
+                    
+        results = []
+        for file in files:
+            outcome = checks["compile"].get(file, "not checked")
+            results.append((f"Compile {file}", outcome is True, "" if outcome is True else outcome))
+        for module in modules:
+            outcome = checks["import"].get(module, "not checked")
+            results.append((f"Import {module}", outcome is True, "" if outcome is True else outcome))
+        return results
+        
     def build_application(self) -> bool:
     # TODO: Consider breaking this function into smaller functions
         """Build the application"""
@@ -165,22 +254,22 @@ class AutomationManager:
                     
         # Build executable
         build_command = [
-            "uv run pyinstaller",
+            "uv", "run", "pyinstaller",
             "--onefile",
             "--console",
-            "--name devochat",
-            "--add-data sample-config.yml;.",
-            "--add-data templates.py;.",
-            "--add-data utils.py;.",
-            "--add-data auto_setup.py;.",
-            "--add-data repocontainerizer.py;.",
-            "--collect-all google.generativeai",
-            "--collect-all rich",
-            "--collect-all click",
-            "--collect-all yaml",
-            "--collect-all requests",
-            "--collect-all git",
-            "--collect-all dotenv",
+            "--name", "devochat",
+            "--add-data", "sample-config.yml;.",
+            "--add-data", "templates.py;.",
+            "--add-data", "utils.py;.",
+            "--add-data", "auto_setup.py;.",
+            "--add-data", "repocontainerizer.py;.",
+            "--collect-all", "google.generativeai",
+            "--collect-all", "rich",
+            "--collect-all", "click",
+            "--collect-all", "yaml",
+            "--collect-all", "requests",
+            "--collect-all", "git",
+            "--collect-all", "dotenv",
             "--hidden-import=google.generativeai",
             "--hidden-import=rich",
             "--hidden-import=click",
@@ -196,7 +285,7 @@ class AutomationManager:
             "chat.py"
         ]
         
-        success, output = self.execute_command(" ".join(build_command))
+        success, output = self.execute_command(build_command)
         if not success:
             print(f"❌ Build failed: {output}")
             return False
@@ -207,7 +296,7 @@ class AutomationManager:
             print("❌ Executable not found")
             return False
             
-        success, _ = self.execute_command(f'"{exe_path}" --help')
+        success, _ = self.execute_command([str(exe_path), "--help"])
         if not success:
             print("❌ Executable test failed")
             return False
@@ -233,25 +322,31 @@ class AutomationManager:
             ("launch_devochat.bat", "launch_devochat.bat")
         ]
         
-        for src, dst in files_to_copy:
-            src_path = self.root_dir / src
-            if src_path.exists():
-                shutil.copy2(src_path, release_dir / dst)
+        # Copies are disk-bound, so overlap them
+        copies = [(self.root_dir / src, release_dir / dst) for src, dst in files_to_copy
+                  if (self.root_dir / src).exists()]
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(lambda pair: fast_copy(*pair), copies))
                 
         # Create build info
         exe_path = release_dir / "devochat.exe"
+        try:
+            exe_stat = exe_path.stat()
+        except FileNotFoundError:
+            exe_stat = None
         build_info = {
             "build_date": datetime.now().isoformat(),
             "version": "1.0.0",
             "platform": "Windows",
-            "file_size": exe_path.stat().st_size if exe_path.exists() else 0,
+            "file_size": exe_stat.st_size if exe_stat else 0,
+            "sha256": sha256_file(exe_path) if exe_stat else None,
             "python_version": "3.11.9",
             "uv_version": "0.7.19",
             "pyinstaller_version": "6.14.2"
         }
         
-        with open(release_dir / "build_info.json", 'w') as f:
-            json.dump(build_info, f, indent=2)
+        with open(release_dir / "build_info.json", 'wb') as f:
+            f.write(json_bytes(build_info))
             
         print("✅ Release package created")
         return True
@@ -296,8 +391,8 @@ def main():
     manager = AutomationManager()
     
     if args.config:
-        with open(args.config, 'r') as f:
-            manager.config = json.load(f)
+        with open(args.config, 'rb') as f:
+            manager.config = json_loads(f.read())
             
     if args.action == "full":
         success = manager.run_full_automation()
@@ -1,20 +1,95 @@
 from datetime import datetime
 from pathlib import Path
 import concurrent.futures
-import json
+import itertools
 import os
-import shutil
 import signal
 import subprocess
 import sys
 import threading
 import time
 
+from utils import fast_copy, force_rmtree, json_bytes, sha256_file, tool_available
+
 """
 DevO Chat - Autonomous Build Agent
 Ultimate automation with zero user interaction and intelligent error handling
 """
 
+# build_status.json is rewritten at most this often, in seconds
+_STATUS_FLUSH_INTERVAL = 0.5
+
+# Keep Windows from allocating a console window for every child process
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Long-lived import checker: reads one module name per stdin line and answers
+# "OK" or "ERR <reason>"; module output goes to stderr so replies stay in step
+_IMPORT_WORKER = (
+    "import contextlib, importlib, sys\n"
+    "for line in sys.stdin:\n"
+    "    name = line.strip()\n"
+    "    try:\n"
+    "        with contextlib.redirect_stdout(sys.stderr):\n"
+    "            importlib.import_module(name)\n"
+    "        print('OK')\n"
+    "    except (Exception, SystemExit) as e:\n"
+    "        print('ERR', f'{type(e).__name__}: {e}'.replace('\\n', ' '))\n"
+)
+
+# Never descended into when sweeping for stale build files
+_CLEANUP_SKIP_DIRS = frozenset({".git", ".venv", "venv", "node_modules"})
+
+
+def _iter_cleanup_files(root, top_suffixes, nested_suffixes):
+    """Yield files in root ending in top_suffixes and in its subdirectories ending in nested_suffixes"""
+    stack = [(os.fspath(root), top_suffixes)]
+    while stack:
+        directory, suffixes = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # scandir's entry types come from readdir, so no stat per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _CLEANUP_SKIP_DIRS:
+                            stack.append((entry.path, nested_suffixes))
+                    elif entry.name.endswith(suffixes):
+                        yield entry.path
+        except OSError:
+            continue
+
+
+def _unlink_batch(paths):
+    """Delete files grouped by directory, returning (path, error) for each failure"""
+    # Where dir_fd is supported, each directory is opened once and its files are
+    # removed with unlinkat relative to it, resolving the path once per batch
+    by_dir = {}
+    for path in paths:
+        directory, name = os.path.split(os.fspath(path))
+        by_dir.setdefault(directory or ".", []).append(name)
+        
+    use_dir_fd = os.unlink in os.supports_dir_fd
+    errors = []
+    for directory, names in by_dir.items():
+        dir_fd = None
+        if use_dir_fd:
+            try:
+                dir_fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                dir_fd = None
+        try:
+            for name in names:
+                try:
+                    if dir_fd is not None:
+                        os.unlink(name, dir_fd=dir_fd)
+                    else:
+                        os.unlink(os.path.join(directory, name))
+                except OSError as e:
+                    errors.append((os.path.join(directory, name), e))
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    return errors
+
 
 class AutonomousBuildAgent:
     """Fully autonomous agent that handles everything without user input"""
@@ -43,22 +118,71 @@ class AutonomousBuildAgent:
             "warnings": [],
             "completed": False
         }
+        # Stages run on worker threads, so every change to build_status goes
+        # through _set_status/_append_status, which hold this lock
+        self._status_lock = threading.Lock()
+        # Held by a flush from snapshot to replace; always taken before _status_lock
+        self._status_write_lock = threading.Lock()
+        # Set on each status change; a background writer flushes each burst of updates once
+        self._status_dirty = threading.Event()
+        threading.Thread(target=self._status_writer, daemon=True).start()
+        
+    def _set_status(self, **fields):
+        """Update build_status fields under the status lock"""
+        with self._status_lock:
+            self.build_status.update(fields)
+        self._status_dirty.set()
+        
+    def _append_status(self, key, message):
+        """Append to one of build_status's lists under the status lock"""
+        with self._status_lock:
+            self.build_status[key].append(message)
+        self._status_dirty.set()
         
     def update_status(self, stage, progress, message=""):
         """Update build status"""
-        self.build_status.update({
-            "stage": stage,
-            "progress": progress,
-            "last_update": datetime.now().isoformat(),
-            "message": message
-        })
-        
-        with open(self.status_file, "w") as f:
-            json.dump(self.build_status, f, indent=2)
+        self._set_status(
+            stage=stage,
+            progress=progress,
+            last_update=datetime.now().isoformat(),
+            message=message
+        )
+        
+    def _status_writer(self):
+        """Background loop writing build_status.json at most every _STATUS_FLUSH_INTERVAL"""
+        while True:
+            self._status_dirty.wait()
+            time.sleep(_STATUS_FLUSH_INTERVAL)
+            self.flush_status()
+            
+    def flush_status(self):
+        """Write build_status.json now, via a temp file so readers never see a torn write"""
+        tmp_file = self.status_file.with_name(self.status_file.name + ".tmp")
+        error = None
+        # Writers take turns from snapshot to replace, so an older snapshot can
+        # never land on top of a newer one; mutators only wait for the copy
+        with self._status_write_lock:
+            with self._status_lock:
+                self._status_dirty.clear()
+                snapshot = {k: list(v) if isinstance(v, list) else v for k, v in self.build_status.items()}
+                
+            try:
+                data = json_bytes(snapshot)
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.status_file)
+            except OSError:
+                # e.g. a reader holding the file open on Windows; retry on the next tick
+                self._status_dirty.set()
+            except Exception as e:
+                error = e
+                
+        if error is not None:
+            self.log(f"Could not write {self.status_file.name}: {error}", "WARNING", record=False)
             
-    def log(self, message, level="INFO"):
+    def log(self, message, level="INFO", record=True):
     # TODO: Consider breaking this function into smaller functions
-        """Autonomous logging"""
+        """Autonomous logging; errors and warnings are also recorded in build_status unless record is False"""
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}"
         
@@ -79,21 +203,23 @@ class AutonomousBuildAgent:
             f.write(log_entry + "\n")
             
         # Update status
+        if not record:
+            return
         if level == "ERROR":
-            self.build_status["errors"].append(message)
+            self._append_status("errors", message)
         elif level == "WARNING":
-            self.build_status["warnings"].append(message)
+            self._append_status("warnings", message)
             
     def run_command_autonomous(self, command, timeout=300, retry_count=0):
     # TODO: Consider breaking this function into smaller functions
-        """Run command with autonomous error handling and retry logic"""
+        """Run an argv list (no shell) with autonomous error handling and retry logic"""
         try:
             result = subprocess.run(
                 command,
-                shell=True,
                 capture_output=True,
                 text=True,
-                timeout=timeout
+                timeout=timeout,
+                creationflags=_CREATION_FLAGS
             )
             
             if result.returncode == 0:
@@ -101,8 +227,7 @@ class AutonomousBuildAgent:
             else:
                 # Intelligent error handling
                 if retry_count < self.config["max_retries"] and self.config["auto_retry"]:
-                    self.log(f"Command failed,
-                        retrying ({retry_count + 1}/{self.config['max_retries']})...", "WARNING")
+                    self.log(f"Command failed, retrying ({retry_count + 1}/{self.config['max_retries']})...", "WARNING")
                     time.sleep(2 ** retry_count)  # Exponential backoff
                     return self.run_command_autonomous(command, timeout, retry_count + 1)
                 else:
@@ -119,9 +244,9 @@ class AutonomousBuildAgent:
         self.update_status("process_cleanup", 10)
         
         cleanup_strategies = [
-            "taskkill /F /IM devochat.exe",
-            "wmic process where name='devochat.exe' delete",
-            "powershell -Command \"Get-Process -Name 'devochat' -ErrorAction SilentlyContinue | Stop-Process -Force\""
+            ["taskkill", "/F", "/IM", "devochat.exe"],
+            ["wmic", "process", "where", "name='devochat.exe'", "delete"],
+            ["powershell", "-Command", "Get-Process -Name 'devochat' -ErrorAction SilentlyContinue | Stop-Process -Force"]
         ]
         
         for strategy in cleanup_strategies:
@@ -133,6 +258,11 @@ class AutonomousBuildAgent:
         self.log("Process cleanup completed", "SUCCESS")
         return True
         
+    def _version_check(self, command):
+        """Run a `<tool> --version` probe for utils.tool_available"""
+        success, _, _ = self.run_command_autonomous(command, timeout=10)
+        return success
+        
     def autonomous_prerequisite_setup(self):
     # TODO: Consider breaking this function into smaller functions
         """Autonomous prerequisite validation and installation"""
@@ -140,17 +270,17 @@ class AutonomousBuildAgent:
         self.update_status("prerequisites", 20)
         
         # Check and install UV
-        success, _, _ = self.run_command_autonomous("uv --version", timeout=10)
+        success = tool_available("uv", self._version_check)
         if not success:
             self.log("UV not found - performing autonomous installation", "WARNING")
-            install_cmd = 'powershell -Command "& {Invoke-RestMethod https://astral.sh/uv/install.ps1 | Invoke-Expression}"'
+            install_cmd = ["powershell", "-Command", "& {Invoke-RestMethod https://astral.sh/uv/install.ps1 | Invoke-Expression}"]
             success, _, error = self.run_command_autonomous(install_cmd, timeout=120)
             if not success:
                 self.log(f"UV installation failed: {error}", "ERROR")
                 return False
                 
         # Verify Python
-        success, _, _ = self.run_command_autonomous("python --version", timeout=10)
+        success = tool_available("python", self._version_check)
         if not success:
             self.log("Python not available", "ERROR")
             return False
@@ -166,9 +296,9 @@ class AutonomousBuildAgent:
         
         # Multiple environment setup strategies
         setup_commands = [
-            "uv sync --extra build",
-            "uv sync --extra build --no-cache",
-            "uv sync --extra build --reinstall"
+            ["uv", "sync", "--extra", "build"],
+            ["uv", "sync", "--extra", "build", "--no-cache"],
+            ["uv", "sync", "--extra", "build", "--reinstall"]
         ]
         
         for cmd in setup_commands:
@@ -189,14 +319,7 @@ class AutonomousBuildAgent:
         
         modules = ["chat", "auto_setup", "utils", "templates", "repocontainerizer"]
         
-        # Parallel validation
-        def validate_module(module):
-            success, _, error = self.run_command_autonomous(f'uv run python -c "import {module}"', timeout=30)
-            return module, success, error
-            
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
-            results = list(executor.map(validate_module, modules))
-            
+        results = self.validate_modules(modules, timeout=30)
         failed_modules = [module for module, success, error in results if not success]
         
         if failed_modules:
@@ -206,6 +329,45 @@ class AutonomousBuildAgent:
         self.log("Code validation completed autonomously", "SUCCESS")
         return True
         
+    def validate_modules(self, modules, timeout=30):
+        """Import each module in one shared interpreter, returning (module, success, error) tuples"""
+        try:
+            proc = subprocess.Popen(
+                ["uv", "run", "python", "-u", "-c", _IMPORT_WORKER],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                creationflags=_CREATION_FLAGS
+            )
+        except OSError as e:
+            return [(module, False, str(e)) for module in modules]
+            
+        # A hung import must not block the agent; killing the worker ends every readline
+        watchdog = threading.Timer(timeout * len(modules), proc.kill)
+        watchdog.start()
+        results = []
+        try:
+            for module in modules:
+                try:
+                    proc.stdin.write(module + "\n")
+                    proc.stdin.flush()
+                    reply = proc.stdout.readline()
+                except OSError:
+                    reply = ""
+                if reply.startswith("OK"):
+                    results.append((module, True, ""))
+                else:
+                    results.append((module, False, reply[4:].strip() or "validation worker exited"))
+        finally:
+            watchdog.cancel()
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+            proc.wait()
+        return results
+        
     def autonomous_aggressive_cleanup(self):
     # TODO: Consider breaking this function into smaller functions
         """Autonomous aggressive cleanup with recovery"""
@@ -215,29 +377,29 @@ class AutonomousBuildAgent:
         # Cleanup targets
         cleanup_targets = {
             "directories": ["build", "dist", "release", "__pycache__"],
-            "files": ["*.spec", "*.log", "*.pyc"],
-            "patterns": ["**/**.pyc", "**/__pycache__/**"]
+            "files": (".spec", ".log", ".pyc"),
+            "nested_files": (".pyc",)
         }
         
-        # Directory cleanup
+        # Directory cleanup, in-process; read-only entries are retried writable
         for directory in cleanup_targets["directories"]:
             dir_path = self.root_dir / directory
             if dir_path.exists():
                 try:
-                    shutil.rmtree(dir_path)
-                    time.sleep(0.5)
-                except Exception as e:
+                    force_rmtree(dir_path)
+                except OSError as e:
                     self.log(f"Cleanup warning for {directory}: {e}", "WARNING")
-                    # Force cleanup
-                    self.run_command_autonomous(f'rmdir /s /q "{dir_path}"', timeout=10)
                     
         # File cleanup
-        for pattern in cleanup_targets["files"]:
-            for file_path in self.root_dir.glob(pattern):
-                try:
-                    file_path.unlink()
-                except Exception as e:
-                    self.log(f"File cleanup warning: {e}", "WARNING")
+        # The agent's own log is still being written, so it is never a target
+        active_log = os.fspath(self.log_file)
+        matched = (
+            path for path in
+            _iter_cleanup_files(self.root_dir, cleanup_targets["files"], cleanup_targets["nested_files"])
+            if path != active_log
+        )
+        for file_path, e in _unlink_batch(matched):
+            self.log(f"File cleanup warning: {e}", "WARNING")
                     
         self.log("Aggressive cleanup completed autonomously", "SUCCESS")
         return True
@@ -250,27 +412,27 @@ class AutonomousBuildAgent:
         
         # Optimized build command
         build_command = [
-            "uv run pyinstaller",
+            "uv", "run", "pyinstaller",
             "--onefile",
             "--console",
-            "--name devochat",
-            "--distpath dist",
-            "--workpath build",
-            "--specpath .",
+            "--name", "devochat",
+            "--distpath", "dist",
+            "--workpath", "build",
+            "--specpath", ".",
             "--optimize=2",  # Bytecode optimization
             "--strip",       # Strip debug symbols
-            "--add-data sample-config.yml;.",
-            "--add-data templates.py;.",
-            "--add-data utils.py;.",
-            "--add-data auto_setup.py;.",
-            "--add-data repocontainerizer.py;.",
-            "--collect-all google.generativeai",
-            "--collect-all rich",
-            "--collect-all click",
-            "--collect-all yaml",
-            "--collect-all requests",
-            "--collect-all git",
-            "--collect-all dotenv",
+            "--add-data", "sample-config.yml;.",
+            "--add-data", "templates.py;.",
+            "--add-data", "utils.py;.",
+            "--add-data", "auto_setup.py;.",
+            "--add-data", "repocontainerizer.py;.",
+            "--collect-all", "google.generativeai",
+            "--collect-all", "rich",
+            "--collect-all", "click",
+            "--collect-all", "yaml",
+            "--collect-all", "requests",
+            "--collect-all", "git",
+            "--collect-all", "dotenv",
             "--hidden-import=google.generativeai",
             "--hidden-import=rich",
             "--hidden-import=click",
@@ -289,7 +451,7 @@ class AutonomousBuildAgent:
             "chat.py"
         ]
         
-        success, stdout, stderr = self.run_command_autonomous(" ".join(build_command), timeout=600)
+        success, stdout, stderr = self.run_command_autonomous(build_command, timeout=600)
         
         if not success:
             self.log(f"Build execution failed: {stderr}", "ERROR")
@@ -324,14 +486,14 @@ class AutonomousBuildAgent:
         
         # Functional tests
         test_commands = [
-            f'"{exe_path}" --help',
-            f'"{exe_path}" --version',
+            [str(exe_path), "--help"],
+            [str(exe_path), "--version"],
         ]
         
         for test_cmd in test_commands:
             success, stdout, stderr = self.run_command_autonomous(test_cmd, timeout=30)
             if not success:
-                self.log(f"Test failed: {test_cmd} - {stderr}", "ERROR")
+                self.log(f"Test failed: {subprocess.list2cmdline(test_cmd)} - {stderr}", "ERROR")
                 return False
                 
         self.log("Testing validation completed autonomously", "SUCCESS")
@@ -349,7 +511,7 @@ class AutonomousBuildAgent:
         # Copy executable
         exe_src = self.root_dir / "dist" / "devochat.exe"
         exe_dst = release_dir / "devochat.exe"
-        shutil.copy2(exe_src, exe_dst)
+        copies = [(exe_src, exe_dst)]
         
         # Copy documentation
         docs_to_copy = [
@@ -363,9 +525,15 @@ class AutonomousBuildAgent:
         for doc in docs_to_copy:
             src = self.root_dir / doc
             if src.exists():
-                shutil.copy2(src, release_dir / doc)
+                copies.append((src, release_dir / doc))
+                
+        # Copies are disk-bound, so the executable and docs overlap
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda pair: fast_copy(*pair), copies))
                 
-        # Create comprehensive build info
+        # Create comprehensive build info; the executable was just copied, so
+        # hashing it reads from the page cache
+        exe_stat = exe_dst.stat()
         build_info = {
             "build_date": datetime.now().isoformat(),
             "build_mode": "Fully Autonomous",
@@ -373,7 +541,8 @@ class AutonomousBuildAgent:
             "python_version": "3.11.9",
             "uv_version": "0.7.19",
             "pyinstaller_version": "6.14.2",
-            "file_size": exe_dst.stat().st_size,
+            "file_size": exe_stat.st_size,
+            "sha256": sha256_file(exe_dst),
             "build_time": time.time() - self.start_time,
             "autonomous_agent": "v1.0",
             "optimization_level": "maximum",
@@ -381,8 +550,8 @@ class AutonomousBuildAgent:
             "distribution_ready": True
         }
         
-        with open(release_dir / "build_info.json", "w") as f:
-            json.dump(build_info, f, indent=2)
+        with open(release_dir / "build_info.json", "wb") as f:
+            f.write(json_bytes(build_info))
             
         # Create autonomous README
         readme_content = f"""# DevO Chat - Autonomous Build
@@ -406,6 +575,7 @@ This executable was created by a fully autonomous build agent with zero user int
 - **Build Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 - **Build Mode**: Fully Autonomous
 - **File Size**: {build_info['file_size']:,} bytes
+- **SHA-256**: `{build_info['sha256']}`
 - **Build Time**: {build_info['build_time']:.2f} seconds
 - **Validation**: ✅ Passed all autonomous tests
 
@@ -422,6 +592,14 @@ This executable is fully tested and ready for immediate distribution.
         self.log("Distribution creation completed autonomously", "SUCCESS")
         return True
         
+    def run_stage_chain(self, stages, counter, total_stages):
+        """Run stages in order, returning the name of the first one that fails"""
+        for stage_name, stage_func in stages:
+            self.log(f"[{next(counter)}/{total_stages}] {stage_name}", "STAGE")
+            if not stage_func():
+                return stage_name
+        return None
+        
     def run_autonomous_agent(self):
     # TODO: Consider breaking this function into smaller functions
         """Run the complete autonomous agent"""
@@ -432,34 +610,46 @@ This executable is fully tested and ready for immediate distribution.
             if log_file.exists():
                 log_file.unlink()
                 
-        # Define autonomous stages
-        autonomous_stages = [
-            ("Process Cleanup", self.autonomous_process_cleanup),
-            ("Prerequisite Setup", self.autonomous_prerequisite_setup),
+        # Define autonomous stages. Prerequisite setup touches nothing the
+        # cleanup chain deletes, so it runs beside it; cleanup must wait for
+        # devochat.exe to die so dist/ is unlocked. Environment setup and
+        # everything after it start only once both chains have finished
+        parallel_chains = [
+            [("Process Cleanup", self.autonomous_process_cleanup),
+             ("Aggressive Cleanup", self.autonomous_aggressive_cleanup)],
+            [("Prerequisite Setup", self.autonomous_prerequisite_setup)]
+        ]
+        sequential_stages = [
             ("Environment Setup", self.autonomous_environment_setup),
             ("Code Validation", self.autonomous_code_validation),
-            ("Aggressive Cleanup", self.autonomous_aggressive_cleanup),
             ("Build Execution", self.autonomous_build_execution),
             ("Testing Validation", self.autonomous_testing_validation),
             ("Distribution Creation", self.autonomous_distribution_creation)
         ]
+        total_stages = sum(len(chain) for chain in parallel_chains) + len(sequential_stages)
+        counter = itertools.count(1)
         
         # Execute stages autonomously
-        for i, (stage_name, stage_func) in enumerate(autonomous_stages, 1):
-            self.log(f"[{i}/{len(autonomous_stages)}] {stage_name}", "STAGE")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(parallel_chains)) as executor:
+            failures = list(executor.map(lambda chain: self.run_stage_chain(chain, counter, total_stages),
+                                         parallel_chains))
+        failed_stage = next((stage for stage in failures if stage), None)
+        if failed_stage is None:
+            failed_stage = self.run_stage_chain(sequential_stages, counter, total_stages)
             
-            if not stage_func():
-                self.log(f"Autonomous agent failed at: {stage_name}", "ERROR")
-                self.build_status["completed"] = False
-                self.build_status["failed_at"] = stage_name
-                self.update_status("failed", (i/len(autonomous_stages))*100)
-                return False
+        if failed_stage is not None:
+            started = next(counter) - 1
+            self.log(f"Autonomous agent failed at: {failed_stage}", "ERROR")
+            self._set_status(completed=False, failed_at=failed_stage)
+            self.update_status("failed", (started/total_stages)*100)
+            self.flush_status()
+            return False
                 
         # Success completion
         total_time = time.time() - self.start_time
-        self.build_status["completed"] = True
-        self.build_status["total_time"] = total_time
+        self._set_status(completed=True, total_time=total_time)
         self.update_status("completed", 100, "Autonomous build completed successfully")
+        self.flush_status()
         
         # Final autonomous success message
         print("\n" + "="*50)
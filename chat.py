@@ -1,5 +1,3 @@
-                from rich.prompt import Confirm
-    from dotenv import load_dotenv
 from auto_setup import AutoSetupManager
 from datetime import datetime
 from pathlib import Path
@@ -11,14 +9,13 @@ from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.prompt import Prompt
+from rich.prompt import Confirm, Prompt
 from rich.spinner import Spinner
 from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 from templates import get_dockerfile_template
 from typing import Dict, List, Optional, Any
-from utils import (
 import asyncio
 import click
 import google.generativeai as genai
@@ -39,13 +36,15 @@ dependency management, containerization, and all development tasks in one place.
 
 
 
-# Load environment variables
+# Load environment variables; python-dotenv is optional
 try:
+    from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
-    self.log(f"Exception occurred: {e}", "ERROR")
+    pass
 
 # Import from existing modules
+from utils import (
     detect_language_from_files, detect_framework_from_files, 
     detect_package_manager, extract_dependencies
 )
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Regression tests for the advanced code editor agent's analysis and fixing
+"""
+from pathlib import Path
+
+import atexit
+import gc
+import os
+
+import pytest
+
+import advanced_code_editor_agent
+from advanced_code_editor_agent import AdvancedCodeEditorAgent, _ast_cache_get, analyze_source_file
+
+LONG_LIST = "x = [" + ", ".join(f"'value_number_{i}'" for i in range(12)) + "]\n"
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    """Agent rooted in a scratch directory, so logs and backups stay out of the repo"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    with AdvancedCodeEditorAgent() as agent:
+        yield agent
+
+def write_source(tmp_path: Path, source: str) -> Path:
+    path = tmp_path / "sample.py"
+    path.write_text(source, encoding="utf-8")
+    return path
+
+def issues_of(analysis, issue_type):
+    return [(i.line_number, i.description) for i in analysis["issues"] if i.issue_type == issue_type]
+
+def test_unused_imports(tmp_path):
+    """Imports are unused only when none of the names they bind is referenced"""
+    analysis = analyze_source_file(write_source(tmp_path, (
+        "import os, sys\n"
+        "import os.path\n"
+        "import json as j\n"
+        "from typing import List, Dict as D\n"
+        "from collections import *\n"
+        "print(sys.argv, D)\n"
+    )))
+
+    assert issues_of(analysis, "import") == [
+        (1, "Unused import: os"),
+        (1, "Unused import: os.path"),
+        (1, "Unused import: json"),
+    ]
+
+def test_attribute_use_counts_as_use(tmp_path):
+    analysis = analyze_source_file(write_source(tmp_path, "import os.path\nprint(os.path.sep)\n"))
+    assert issues_of(analysis, "import") == []
+
+def test_todo_comments_once_per_line(tmp_path):
+    analysis = analyze_source_file(write_source(tmp_path, (
+        "x = 1  # TODO tidy\n"
+        "y = 2\n"
+        "# TODO one FIXME two\n"
+    )))
+    assert issues_of(analysis, "todo") == [(1, "TODO/FIXME comment found"), (3, "TODO/FIXME comment found")]
+
+def test_empty_except_blocks(tmp_path):
+    """Bare and typed excepts whose body is only pass are flagged, at the except line"""
+    analysis = analyze_source_file(write_source(tmp_path, (
+        "try:\n"
+        "    x = 1\n"
+        "except:\n"
+        "    pass\n"
+        "try:\n"
+        "    x = 2\n"
+        "except ValueError as e:\n"
+        "    pass\n"
+        "try:\n"
+        "    x = 3\n"
+        "except Exception as e:\n"
+        "    print(e)\n"
+    )))
+    assert issues_of(analysis, "exception") == [(3, "Empty except block"), (7, "Empty except block")]
+
+def test_long_lines(tmp_path):
+    """Lines over 100 characters are flagged; exactly 100 is fine"""
+    ok = "a = '" + "x" * 94 + "'"
+    too_long = "b = '" + "x" * 95 + "'"
+    assert (len(ok), len(too_long)) == (100, 101)
+    analysis = analyze_source_file(write_source(tmp_path, f"{ok}\n{too_long}\n"))
+    assert issues_of(analysis, "style") == [(2, "Line too long (101 chars)")]
+
+def test_quality_score(tmp_path):
+    """100, minus 1 per long line, 2 per TODO line, 5 per empty except and 1 per unused import"""
+    too_long = "b = '" + "x" * 95 + "'"
+    analysis = analyze_source_file(write_source(tmp_path, (
+        "import os\n"
+        "import sys\n"
+        f"{too_long}\n"
+        "# TODO\n"
+        "try:\n"
+        "    pass\n"
+        "except:\n"
+        "    pass\n"
+    )))
+    assert analysis["quality_score"] == 100 - 1 - 2 - 5 - 2
+    assert analysis["code_quality"] == "excellent"
+
+    clean = analyze_source_file(write_source(tmp_path, "print('hi')\n"))
+    assert (clean["quality_score"], clean["code_quality"]) == (100, "excellent")
+
+    bad = analyze_source_file(write_source(tmp_path, "try:\n    pass\nexcept:\n    pass\n" * 5))
+    assert (bad["quality_score"], bad["code_quality"]) == (75, "fair")
+
+def test_fixes_apply_bottom_up(agent, tmp_path):
+    """Removing imports at the top must not stop a later long line from being split"""
+    source = (
+        "import os\nimport sys\nimport json\n\n"
+        "def f(a, b):\n    return a\n"
+        + "\n" * 8
+        + LONG_LIST
+    )
+    path = write_source(tmp_path, source)
+    assert source.split("\n")[14] == LONG_LIST.rstrip("\n")
+
+    issues = agent.advanced_code_analysis(path)["issues"]
+    assert {i.issue_type for i in issues} >= {"import", "style"}
+
+    agent.intelligent_code_fixing(path, issues)
+
+    fixed = path.read_text(encoding="utf-8")
+    assert "import os" not in fixed
+    assert "import sys" not in fixed
+    assert "import json" not in fixed
+    assert all(len(line) <= 100 for line in fixed.split("\n"))
+    assert "'value_number_11']" in fixed
+
+def test_ast_cache_stays_out_of_project(agent, tmp_path):
+    """Parsed trees are cached under the user cache dir, not the analysed tree"""
+    assert agent.ast_cache_dir == tmp_path / "cache" / "devo-ast"
+    agent.advanced_code_analysis(write_source(tmp_path, "def f():\n    return 1\n"))
+    assert not (tmp_path / ".devo_cache").exists()
+
+def test_ast_cache_treats_bad_entries_as_miss(tmp_path, monkeypatch):
+    """A corrupt pickle is reparsed and replaced, leaving no temp files behind"""
+    monkeypatch.setattr(advanced_code_editor_agent, "_AST_MEMO", type(advanced_code_editor_agent._AST_MEMO)())
+    source = b"value = 42\n"
+    _ast_cache_get(source, tmp_path)
+    (entry,) = tmp_path.glob("*.pkl")
+    entry.write_bytes(b"not a pickle")
+    advanced_code_editor_agent._AST_MEMO.clear()
+
+    tree = _ast_cache_get(source, tmp_path)
+
+    assert tree.body[0].targets[0].id == "value"
+    assert [p.name for p in tmp_path.iterdir()] == [entry.name]
+
+def test_ast_memo_is_bounded(monkeypatch):
+    """The in-process memo evicts the least recently used trees"""
+    monkeypatch.setattr(advanced_code_editor_agent, "_AST_MEMO", type(advanced_code_editor_agent._AST_MEMO)())
+    monkeypatch.setattr(advanced_code_editor_agent, "_AST_MEMO_MAX", 2)
+    first = _ast_cache_get(b"a = 1\n")
+    _ast_cache_get(b"b = 2\n")
+    assert _ast_cache_get(b"a = 1\n") is first
+    _ast_cache_get(b"c = 3\n")
+    assert len(advanced_code_editor_agent._AST_MEMO) == 2
+    assert _ast_cache_get(b"a = 1\n") is first
+
+def test_stages_share_one_process_pool(agent, tmp_path):
+    """Every stage maps over the same worker processes instead of starting new ones"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"module_{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n", encoding="utf-8")
+        paths.append(path)
+
+    agent.analyze_files(paths)
+    pool = agent._pool
+    assert pool is not None
+    for path in paths:
+        path.write_text(path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    agent.analyze_files(paths)
+    assert agent._pool is pool
+
+    agent.close_pool()
+    assert agent._pool is None
+
+def test_log_handles_do_not_pile_up_at_exit(tmp_path, monkeypatch):
+    """Agents no longer register an atexit handler each; collected ones close their log"""
+    monkeypatch.chdir(tmp_path)
+    before = atexit._ncallbacks()
+    for _ in range(5):
+        agent = AdvancedCodeEditorAgent()
+        agent.log("hello")
+        handle = agent._log_fh
+        del agent
+        gc.collect()
+        assert handle.closed
+    assert atexit._ncallbacks() == before
+    assert (tmp_path / "advanced_agent.log").read_text(encoding="utf-8").count("hello") == 5
+
+@pytest.mark.skipif(not hasattr(os, "O_ACCMODE"), reason="needs fcntl access modes")
+def test_documentation_fsyncs_writable_descriptors(agent, tmp_path, monkeypatch):
+    """fsync needs a writable handle on Windows (FlushFileBuffers), so files are synced before close"""
+    import fcntl
+    real_fsync = os.fsync
+    modes = []
+
+    def recording_fsync(fd):
+        modes.append(fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_ACCMODE)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+    release_dir = tmp_path / "release"
+    release_dir.mkdir()
+    agent.create_advanced_documentation(release_dir, fsync=True)
+
+    assert (release_dir / "README.md").exists()
+    assert (release_dir / "technical_report.json").exists()
+    file_modes = [m for m in modes if m != os.O_RDONLY]
+    assert len(file_modes) == 2
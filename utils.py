@@ -1,14 +1,28 @@
 #!/usr/bin/env python3
 """
-Utility functions for repository analysis and containerization
+Utility functions for repository analysis and containerization, plus the
+file, JSON and cache helpers shared by the build and automation scripts
 """
 
 import os
 import re
 import json
-from typing import Dict, List, Optional, Tuple
+import ctypes
+import hashlib
+import shutil
+import stat
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from pathlib import Path
 
+# Optional faster JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 def detect_language_from_files(files: List[str]) -> Dict[str, int]:
     """Detect programming languages from file extensions"""
     language_extensions = {
@@ -475,4 +489,144 @@ def extract_dependencies(file_contents: Dict[str, str]) -> List[str]:
                 if len(parts) >= 2:
                     dependencies.append(parts[0])
     
-    return list(set(dependencies))  # Remove duplicates
\ No newline at end of file
+    return list(set(dependencies))  # Remove duplicates
+
+def user_cache_dir(name: str) -> Path:
+    """Per-user cache directory for DevO data; never inside the project being worked on"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / name
+
+def json_bytes(obj) -> bytes:
+    """Encode obj as indented JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def json_loads(data):
+    """Parse JSON bytes or text, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_file_bytes(path, data: bytes, fsync: bool = False) -> None:
+    """Write bytes with os.open/os.write, bypassing Python's buffered file layers
+
+    With fsync=True the data is flushed to disk before the descriptor is
+    closed; the descriptor is writable, which FlushFileBuffers needs on Windows.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(path), flags, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+# Read/write buffer for copies and hashes that cannot be done in the kernel
+COPY_BUFFER_SIZE = 1 << 20
+
+def fast_copy(src, dst):
+    """Copy a file and its metadata like shutil.copy2, using the OS's native copy where possible"""
+    if os.name == "nt":
+        # CopyFile2 copies data, attributes and timestamps in one call
+        if ctypes.windll.kernel32.CopyFile2(str(src), str(dst), None) == 0:
+            return dst
+            
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        offset = 0
+        if sys.platform.startswith("linux"):
+            size = os.fstat(fsrc.fileno()).st_size
+            try:
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                pass  # Filesystem without sendfile support; the loop below finishes the copy
+                
+        fsrc.seek(offset)
+        buf = bytearray(COPY_BUFFER_SIZE)
+        view = memoryview(buf)
+        while True:
+            n = fsrc.readinto(buf)
+            if not n:
+                break
+            fdst.write(view[:n])
+            
+    shutil.copystat(src, dst)
+    return dst
+
+def sha256_file(path) -> str:
+    """SHA-256 hex digest of a file, read in COPY_BUFFER_SIZE chunks"""
+    digest = hashlib.sha256()
+    buf = bytearray(COPY_BUFFER_SIZE)
+    view = memoryview(buf)
+    with open(path, "rb") as f:
+        while True:
+            n = f.readinto(buf)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+# How long a successful `<tool> --version` check is trusted
+TOOL_CACHE_TTL = 24 * 60 * 60
+
+def tool_available(tool: str, run: Callable[[Sequence[str]], bool]) -> bool:
+    """Check a tool with run([tool, "--version"]), trusting an earlier success for the same binary"""
+    path = shutil.which(tool)
+    if path is None:
+        return run([tool, "--version"])
+        
+    # The binary's location and mtime change whenever it is reinstalled or upgraded
+    key = hashlib.sha1((path + str(os.path.getmtime(path))).encode()).hexdigest()
+    cache_file = user_cache_dir("devo") / "tool_cache.json"
+    try:
+        with open(cache_file, "rb") as f:
+            cache = json_loads(f.read())
+    except (OSError, ValueError):
+        cache = {}
+        
+    now = time.time()
+    if now - cache.get(key, 0) < TOOL_CACHE_TTL:
+        return True
+        
+    success = run([tool, "--version"])
+    if success:
+        cache = {k: t for k, t in cache.items() if now - t < TOOL_CACHE_TTL}
+        cache[key] = now
+        # Other DevO processes share this file, so replace it whole
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            write_file_bytes(tmp_file, json_bytes(cache))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+    return success
+
+def force_rmtree(path) -> None:
+    """Remove a directory tree, clearing read-only flags (e.g. Git objects on Windows) and retrying"""
+    def handle_remove_readonly(func, failed_path, exc):
+        """Make the entry, and the directory holding it, writable and retry once"""
+        if not os.path.lexists(failed_path):
+            return
+        for target in (os.path.dirname(failed_path), failed_path):
+            try:
+                os.chmod(target, os.lstat(target).st_mode | stat.S_IWRITE)
+            except OSError:
+                pass
+        func(failed_path)
+        
+    # Never follows symlinks or junctions; onerror is deprecated from 3.12
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=handle_remove_readonly)
+    else:
+        shutil.rmtree(path, onerror=handle_remove_readonly)